@@ -5,6 +5,7 @@ Captures comprehensive context including code changes, decisions, and progress
 """
 
 import os
+import re
 import json
 import hashlib
 import subprocess
@@ -21,6 +22,9 @@ CONTEXT_DIR = os.path.join(ADMIN_ROOT, "context")
 DECISIONS_DIR = os.path.join(ADMIN_ROOT, "decisions")
 LOGS_DIR = os.path.join(ADMIN_ROOT, "logs")
 
+# Timestamped snapshot files in CONTEXT_DIR, as opposed to other context_*.json files
+SNAPSHOT_NAME_RE = re.compile(r"context_\d{8}_\d{6}\.json")
+
 # Files/folders to ignore
 IGNORE_PATTERNS = {
     "node_modules", "__pycache__", ".git", "dist", "build", 
@@ -36,6 +40,7 @@ class ProjectContextCapture:
         self.hours_back = hours_back
         self.timestamp = datetime.now()
         self.context_file = self.context_dir / f"context_{self.timestamp.strftime('%Y%m%d_%H%M%S')}.json"
+        self.context_log = self.context_dir / "context.jsonl"
         
         # Create directories if they don't exist
         self.context_dir.mkdir(parents=True, exist_ok=True)
@@ -236,15 +241,40 @@ class ProjectContextCapture:
     
     def get_previous_context(self) -> Dict[str, Any]:
         """Get the most recent previous context for comparison"""
-        context_files = sorted(self.context_dir.glob("context_*.json"))
-        if len(context_files) > 0:
+        # Timestamped names sort chronologically; only the newest is needed, so no sort
+        latest = max(
+            (name for name in os.listdir(self.context_dir)
+             if name.startswith("context_") and name.endswith(".json")),
+            default=None
+        )
+        if latest is not None:
             try:
-                with open(context_files[-1], 'r') as f:
+                with open(self.context_dir / latest, 'r') as f:
                     return json.load(f)
             except:
                 pass
         return {}
     
+    def backfill_context_log(self):
+        """Seed a new context log with the snapshot files captured before it existed"""
+        # Without this, history read from the log would start at the first capture
+        # after the log was introduced and drop every earlier snapshot
+        names = sorted(name for name in os.listdir(self.context_dir) if SNAPSHOT_NAME_RE.fullmatch(name))
+        tmp_log = self.context_log.with_suffix(".jsonl.tmp")
+        with open(tmp_log, 'w') as out:
+            for name in names:
+                try:
+                    with open(self.context_dir / name, 'r') as f:
+                        snapshot = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if not isinstance(snapshot, dict) or "timestamp" not in snapshot:
+                    continue
+                # Move the timestamp key first, as readers expect
+                snapshot = {"timestamp": snapshot["timestamp"], **snapshot}
+                out.write(json.dumps(snapshot, separators=(",", ":"), default=str) + "\n")
+        os.replace(tmp_log, self.context_log)
+    
     def capture_context(self) -> Dict[str, Any]:
         """Main method to capture full context"""
         print(f"🔍 Capturing context at {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -292,10 +322,19 @@ class ProjectContextCapture:
         if prev_context:
             context["changes_since_last"] = self.compare_contexts(prev_context, context)
         
+        # Create the log from existing snapshots before this one is added to both
+        if not self.context_log.exists():
+            self.backfill_context_log()
+        
         # Save context
         with open(self.context_file, 'w') as f:
             json.dump(context, f, indent=2, default=str)
         
+        # Append a compact copy to the snapshot log read by query_context.py.
+        # The timestamp key must stay first so readers can skip old lines unparsed.
+        with open(self.context_log, 'a') as f:
+            f.write(json.dumps(context, separators=(",", ":"), default=str) + "\n")
+        
         print(f"✅ Context saved to {self.context_file}")
         print(f"📊 Summary: {context['summary']['active_projects']}/{context['summary']['total_projects']} active projects")
         print(f"📝 {context['summary']['total_commits']} commits, {context['summary']['total_recent_changes']} file changes")
@@ -13,6 +13,9 @@ import argparse
 from typing import Dict, Any, Optional
 
 DECISIONS_DIR = "/Users/MAC/Documents/projects/admin/decisions"
+# Maps project -> daily decision files that mention it, so per-project queries
+# can skip unrelated files. Deliberately not *.json: readers glob that pattern.
+DECISIONS_INDEX_NAME = "decisions.index"
 
 class DecisionLogger:
     def __init__(self):
@@ -59,6 +62,9 @@ class DecisionLogger:
         with open(daily_file, 'w') as f:
             json.dump(decisions_today, f, indent=2)
         
+        if project:
+            self.update_decisions_index(project, daily_file.name)
+        
         # Also save to individual file for important decisions
         if category in ["architecture", "critical", "milestone"]:
             individual_file = self.decisions_dir / f"decision_{decision['id']}.json"
@@ -67,6 +73,31 @@ class DecisionLogger:
         
         return decision
     
+    def update_decisions_index(self, project: str, file_name: str):
+        """Record that file_name holds decisions for project"""
+        index_file = self.decisions_dir / DECISIONS_INDEX_NAME
+        index = None
+        if index_file.exists():
+            try:
+                with open(index_file, 'r') as f:
+                    index = json.load(f)
+            except:
+                index = None
+        if index is None:
+            # Files up to and including this one may predate the index, so
+            # readers must always scan them rather than trust the index
+            index = {"indexed_from": file_name, "projects": {}}
+        
+        files = index["projects"].setdefault(project, [])
+        if file_name in files:
+            return
+        files.append(file_name)
+        
+        tmp_file = index_file.with_name(index_file.name + ".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_file, index_file)
+    
     def log_progress(self, 
                     project: str,
                     task: str,
@@ -5,21 +5,219 @@ Comprehensive QA automation for code quality, security, testing, and compliance
 """
 
 import os
+import re
 import json
 import subprocess
 import asyncio
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from collections import Counter
 import tempfile
 import hashlib
+import shutil
+import types
+import functools
+import fnmatch
+import operator
+import bisect
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it tool output is parsed in one go
+    ijson = None
 
 PROJECTS_ROOT = "/Users/MAC/Documents/projects"
 ADMIN_ROOT = "/Users/MAC/Documents/projects/admin"
 QA_DIR = os.path.join(ADMIN_ROOT, "qa")
+QA_CACHE_TTL = 24 * 60 * 60  # Seconds a cached project report stays valid
+REPORT_WRITE_BUFFER = 1024 * 1024  # Bytes buffered per report file write
+
+# Directories never descended into when indexing project files
+SKIP_DIRS = {".git", "node_modules", "venv", ".venv", "dist", "build", "__pycache__"}
+SECRET_SCAN_SUFFIXES = [".js", ".ts", ".py", ".json", ".yml", ".yaml", ".env"]
+MAX_SECRET_SCAN_BYTES = 10 * 1024 * 1024  # Larger files are skipped by the secret scan
+BINARY_SNIFF_BYTES = 8000  # Leading bytes checked for NUL to detect binary files
+
+# Secret patterns (ASCII, matched case-insensitively against raw file bytes)
+SECRET_PATTERNS = [
+    rb'api[_-]?key["\s]*[:=]["\s]*[a-zA-Z0-9]+',
+    rb'secret[_-]?key["\s]*[:=]["\s]*[a-zA-Z0-9]+',
+    rb'password["\s]*[:=]["\s]*[a-zA-Z0-9]+',
+    rb'aws[_-]?access[_-]?key["\s]*[:=]["\s]*[A-Z0-9]+',
+    rb'private[_-]?key["\s]*[:=]',
+]
+
+# Fixed tool invocations, shared by every project run
+CMD_ESLINT = ("npx", "eslint", ".", "--format", "json")
+CMD_RUFF = ("ruff", "check", ".", "--output-format", "json")
+CMD_FLAKE8 = ("flake8", ".", "--format=json")
+CMD_NPM_AUDIT = ("npm", "audit", "--json")
+CMD_SAFETY = ("safety", "check", "--json")
+CMD_BANDIT = ("bandit", "-r", ".", "-f", "json")
+CMD_NPM_TEST = ("npm", "test", "--", "--coverage", "--json")
+CMD_PYTEST = ("pytest", "--cov=.", "--cov-report=json", "--json-report")
+CMD_COMPLEXITY_REPORT = ("npx", "complexity-report", "--output", "json", "src/**/*.{js,ts}")
+CMD_JSCPD = ("npx", "jscpd", ".", "--reporters", "json")
+CMD_RADON = ("radon", "cc", ".", "--json")
+CMD_GIT_HEAD = ("git", "rev-parse", "HEAD")
+# Files the QA tools themselves write into the project (pytest-cov, pytest-json-report,
+# jest --coverage, jscpd); they must not make the worktree look dirty to the report cache
+QA_TOOL_OUTPUTS = ("coverage.json", ".coverage", ".report.json", "coverage", "report/jscpd-report.json")
+CMD_GIT_STATUS = ("git", "status", "--porcelain", "--", ".", *(f":(exclude){path}" for path in QA_TOOL_OUTPUTS))
+CMD_GIT_LS_FILES = ("git", "ls-files", "-z", "--cached", "--others", "--exclude-standard")
+
+# Vulnerability severity -> security_results counter; anything else counts as low
+SEVERITY_COUNTERS = {
+    "critical": "critical_vulnerabilities",
+    "high": "high_vulnerabilities",
+    "medium": "medium_vulnerabilities"
+}
+
+# Quality gates, evaluated in order by generate_qa_report:
+# (report section, metric, threshold key, passes(value, threshold), score weight,
+#  recommendation priority, category, issue template, action template)
+QUALITY_GATES = (
+    ("testing", "coverage_percentage", "test_coverage_minimum", operator.ge, 25,
+     "high", "testing",
+     "Test coverage is {report[testing][coverage_percentage]:.1f}%, need {threshold}%",
+     "Add more unit tests and integration tests"),
+    ("linting", "errors", "lint_error_tolerance", operator.le, 25,
+     "medium", "code_quality",
+     "{report[linting][errors]} linting errors found",
+     "Run {report[linting][tool_used]} --fix to auto-fix {report[linting][auto_fixable]} issues"),
+    ("security", "critical_vulnerabilities", "security_vulnerability_tolerance", operator.le, 25,
+     "critical", "security",
+     "{report[security][critical_vulnerabilities]} critical vulnerabilities found",
+     "Update dependencies and fix security issues immediately"),
+    ("code_analysis", "complexity_issues", "complexity_threshold", operator.le, 25,
+     "medium", "maintainability",
+     "{report[code_analysis][complexity_issues]} overly complex functions",
+     "Refactor complex functions to improve maintainability"),
+)
+
+# `npm audit` vulnerability count -> security_results counter
+NPM_AUDIT_COUNTERS = {
+    "total": "vulnerabilities",
+    "critical": "critical_vulnerabilities",
+    "high": "high_vulnerabilities",
+    "moderate": "medium_vulnerabilities",
+    "low": "low_vulnerabilities"
+}
+
+# Score thresholds for each grade step: <60 F, <70 D, <80 C, <90 B, else A
+GRADE_THRESHOLDS = (60, 70, 80, 90)
+GRADES = ("F", "D", "C", "B", "A")
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes (2-space indented if requested), using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str:
+    """Absolute path of an executable, searched for once per process (name itself if not found)"""
+    return shutil.which(name) or name
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _iter_json_prefix(data: Any, path: List[str], pairs: bool = False):
+    """Yield the values (or key/value pairs) at an ijson-style prefix path of parsed JSON"""
+    if not path:
+        if not pairs:
+            yield data
+        elif isinstance(data, dict):
+            yield from data.items()
+        return
+    
+    key, rest = path[0], path[1:]
+    if key == "item":
+        if isinstance(data, list):
+            for value in data:
+                yield from _iter_json_prefix(value, rest, pairs)
+    elif isinstance(data, dict) and key in data:
+        yield from _iter_json_prefix(data[key], rest, pairs)
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only mappings and turn lists into tuples"""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _aggregate_statement_coverage(coverage_map: Dict[str, Any]) -> Tuple[int, int]:
+    """Return (covered, total) statement counts from a Jest coverageMap"""
+    hit_counts = []
+    for file_coverage in coverage_map.values():
+        hit_counts.extend(file_coverage.get("s", {}).values())
+    # Hit counts are never negative, so everything but the zeros was covered
+    return len(hit_counts) - hit_counts.count(0), len(hit_counts)
+
+# QA Configuration, parsed once at import and shared by every QAAutomation instance
+_QA_CONFIG_JSON = """{
+    "quality_gates": {
+        "test_coverage_minimum": 80,
+        "lint_error_tolerance": 0,
+        "security_vulnerability_tolerance": 0,
+        "type_error_tolerance": 0,
+        "complexity_threshold": 10,
+        "duplication_threshold": 3,
+        "performance_score_minimum": 90
+    },
+    "tools": {
+        "linting": {
+            "javascript": ["eslint", "jshint"],
+            "typescript": ["eslint", "@typescript-eslint"],
+            "python": ["ruff", "flake8", "pylint"],
+            "rust": ["clippy"],
+            "go": ["golint", "vet"]
+        },
+        "security": {
+            "javascript": ["audit", "snyk", "security"],
+            "python": ["safety", "bandit", "semgrep"],
+            "docker": ["trivy", "hadolint"],
+            "secrets": ["gitleaks", "detect-secrets"]
+        },
+        "testing": {
+            "javascript": ["jest", "mocha", "playwright"],
+            "python": ["pytest", "unittest", "coverage"],
+            "performance": ["lighthouse", "k6"]
+        },
+        "code_analysis": {
+            "complexity": ["complexity-report", "radon"],
+            "duplication": ["jscpd", "simian"],
+            "dependencies": ["depcheck", "outdated"]
+        }
+    },
+    "automation_rules": {
+        "auto_fix_enabled": true,
+        "auto_format_enabled": true,
+        "auto_test_enabled": true,
+        "auto_security_scan": true,
+        "block_commit_on_failures": true,
+        "notify_on_critical_issues": true
+    }
+}"""
+
+_QA_CONFIG = _freeze(_json_loads(_QA_CONFIG_JSON))
 
 class QAAutomation:
-    def __init__(self):
+    def __init__(self, use_cache: bool = True, cache_ttl: int = QA_CACHE_TTL):
         self.projects_root = Path(PROJECTS_ROOT)
         self.qa_dir = Path(QA_DIR)
         self.qa_dir.mkdir(parents=True, exist_ok=True)
@@ -28,57 +226,31 @@ class QAAutomation:
         for subdir in ["reports", "configs", "security", "coverage", "performance"]:
             (self.qa_dir / subdir).mkdir(exist_ok=True)
         
-        # QA Configuration
-        self.qa_config = {
-            "quality_gates": {
-                "test_coverage_minimum": 80,
-                "lint_error_tolerance": 0,
-                "security_vulnerability_tolerance": 0,
-                "type_error_tolerance": 0,
-                "complexity_threshold": 10,
-                "duplication_threshold": 3,
-                "performance_score_minimum": 90
-            },
-            "tools": {
-                "linting": {
-                    "javascript": ["eslint", "jshint"],
-                    "typescript": ["eslint", "@typescript-eslint"],
-                    "python": ["ruff", "flake8", "pylint"],
-                    "rust": ["clippy"],
-                    "go": ["golint", "vet"]
-                },
-                "security": {
-                    "javascript": ["audit", "snyk", "security"],
-                    "python": ["safety", "bandit", "semgrep"],
-                    "docker": ["trivy", "hadolint"],
-                    "secrets": ["gitleaks", "detect-secrets"]
-                },
-                "testing": {
-                    "javascript": ["jest", "mocha", "playwright"],
-                    "python": ["pytest", "unittest", "coverage"],
-                    "performance": ["lighthouse", "k6"]
-                },
-                "code_analysis": {
-                    "complexity": ["complexity-report", "radon"],
-                    "duplication": ["jscpd", "simian"],
-                    "dependencies": ["depcheck", "outdated"]
-                }
-            },
-            "automation_rules": {
-                "auto_fix_enabled": True,
-                "auto_format_enabled": True,
-                "auto_test_enabled": True,
-                "auto_security_scan": True,
-                "block_commit_on_failures": True,
-                "notify_on_critical_issues": True
-            }
-        }
+        # Persistent report cache, keyed by git HEAD + dependency lockfiles
+        self.use_cache = use_cache
+        self._cache_ttl = cache_ttl
+        self.cache_dir = self.qa_dir / "reports" / "cache"
+        
+        # QA Configuration (shared, read-only)
+        self.qa_config = _QA_CONFIG
+        
+        # All secret patterns as one compiled alternation; group N is SECRET_PATTERNS[N - 1]
+        self._secret_re = re.compile(b"|".join(b"(" + pattern + b")" for pattern in SECRET_PATTERNS), re.IGNORECASE)
+        
+        # Per-project {suffix: [file paths]} index, built once and shared by all QA phases
+        self._file_index: Dict[Path, Dict[str, List[str]]] = {}
+    
+    def resolve_tool(self, name: str) -> str:
+        """Resolve an executable's absolute path once, so later runs skip the PATH search"""
+        # Cached per process rather than per instance: each project gets its own
+        # QAAutomation, but a pool worker should still search PATH only once per tool
+        return _which(name)
     
-    def run_command(self, command: List[str], cwd: Path = None, timeout: int = 300) -> Dict[str, Any]:
+    def run_command(self, command: Sequence[str], cwd: Path = None, timeout: int = 300) -> Dict[str, Any]:
         """Run a command with timeout"""
         try:
             result = subprocess.run(
-                command,
+                [self.resolve_tool(command[0]), *command[1:]],
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -95,6 +267,132 @@ class QAAutomation:
         except Exception as e:
             return {"success": False, "error": str(e), "returncode": -1}
     
+    def stream_json_output(self, command: Sequence[str], prefix: str, status: Dict[str, Any],
+                           cwd: Path = None, timeout: int = 300, pairs: bool = False):
+        """Run a command, yielding the JSON values at `prefix` as its stdout is decoded.
+        
+        `status` is filled with success/returncode once the output is exhausted. With
+        ijson installed only one item is held in memory at a time.
+        """
+        try:
+            proc = subprocess.Popen(
+                [self.resolve_tool(command[0]), *command[1:]],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=cwd or self.projects_root
+            )
+        except Exception as e:
+            status.update({"success": False, "error": str(e), "returncode": -1})
+            return
+        
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        try:
+            if ijson is not None:
+                parse = ijson.kvitems if pairs else ijson.items
+                yield from parse(proc.stdout, prefix, use_float=True)
+            else:
+                yield from _iter_json_prefix(_json_loads(proc.stdout.read()), prefix.split("."), pairs)
+        except Exception:
+            pass  # Malformed or truncated output: keep whatever was decoded
+        finally:
+            # Drain the rest so the tool can exit and report its status
+            while proc.stdout.read(65536):
+                pass
+            proc.stdout.close()
+            proc.wait()
+            timed_out = timer.finished.is_set()
+            timer.cancel()
+            if timed_out:
+                status.update({"success": False, "error": "Command timed out", "returncode": -1})
+            else:
+                status.update({"success": proc.returncode == 0, "returncode": proc.returncode})
+    
+    def list_entries(self, directory: Path) -> set:
+        """Return the names directly inside a directory with a single readdir"""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+    
+    def _walk_entries(self, project_path: Path):
+        """Yield every DirEntry under the project, skipping SKIP_DIRS"""
+        pending = [str(project_path)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS:
+                            pending.append(entry.path)
+                        yield entry
+            except OSError:
+                continue
+    
+    def _has_tracked(self, project_path: Path, patterns: List[str]) -> bool:
+        """Check whether any file or directory name in the project matches a glob pattern"""
+        if (project_path / ".git").is_dir():
+            # Match the pattern against any path component, like "**/<pattern>"
+            pathspecs = []
+            for pattern in patterns:
+                pathspecs.extend([pattern, f"*/{pattern}", f"{pattern}/*", f"*/{pattern}/*"])
+            
+            # Read git's index plus untracked, non-ignored files (like _build_file_index,
+            # so new uncommitted tests count) and stop at the first hit
+            try:
+                proc = subprocess.Popen(
+                    [self.resolve_tool("git"), "ls-files", "-z", "--cached", "--others", "--exclude-standard",
+                     "--", *pathspecs],
+                    cwd=project_path,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+            except OSError:
+                proc = None
+            
+            if proc is not None:
+                found = bool(proc.stdout.read1(1))
+                proc.stdout.close()
+                if found:
+                    proc.kill()
+                proc.wait()
+                if found or proc.returncode == 0:
+                    return found
+        
+        # Not a git checkout (or git failed): fall back to a pruned walk
+        return any(
+            fnmatch.fnmatch(entry.name, pattern)
+            for entry in self._walk_entries(project_path)
+            for pattern in patterns
+        )
+    
+    def _build_file_index(self, project_path: Path) -> Dict[str, List[str]]:
+        """Collect the project's files once, grouping file paths by suffix"""
+        if project_path in self._file_index:
+            return self._file_index[project_path]
+        
+        file_index: Dict[str, List[str]] = {}
+        
+        # Git checkouts: tracked plus untracked-but-not-ignored files, honouring .gitignore
+        result = {"success": False}
+        if (project_path / ".git").is_dir():
+            result = self.run_command(
+                CMD_GIT_LS_FILES, project_path
+            )
+        
+        if result["success"]:
+            for relative_path in filter(None, result["stdout"].split("\0")):
+                suffix = os.path.splitext(relative_path)[1]
+                file_index.setdefault(suffix, []).append(os.path.join(project_path, relative_path))
+        else:
+            for entry in self._walk_entries(project_path):
+                if entry.is_file():
+                    suffix = os.path.splitext(entry.name)[1]
+                    file_index.setdefault(suffix, []).append(entry.path)
+        
+        self._file_index[project_path] = file_index
+        return file_index
+    
     def detect_project_type(self, project_path: Path) -> Dict[str, Any]:
         """Detect project type and technologies"""
         project_info = {
@@ -106,28 +404,30 @@ class QAAutomation:
             "has_docker": False
         }
         
+        top_level = self.list_entries(project_path)
+        
         # Check for different project types
-        if (project_path / "package.json").exists():
+        if "package.json" in top_level:
             project_info["primary_language"] = "javascript"
             project_info["package_managers"].append("npm")
             project_info["technologies"].append("node.js")
             
             # Check for TypeScript
-            if (project_path / "tsconfig.json").exists() or any(project_path.glob("**/*.ts")):
+            if "tsconfig.json" in top_level or self._has_tracked(project_path, ["*.ts"]):
                 project_info["technologies"].append("typescript")
         
-        if (project_path / "requirements.txt").exists() or (project_path / "pyproject.toml").exists():
+        if "requirements.txt" in top_level or "pyproject.toml" in top_level:
             if project_info["primary_language"] == "unknown":
                 project_info["primary_language"] = "python"
             project_info["package_managers"].append("pip")
             project_info["technologies"].append("python")
         
-        if (project_path / "Cargo.toml").exists():
+        if "Cargo.toml" in top_level:
             project_info["primary_language"] = "rust"
             project_info["package_managers"].append("cargo")
             project_info["technologies"].append("rust")
         
-        if (project_path / "go.mod").exists():
+        if "go.mod" in top_level:
             project_info["primary_language"] = "go"
             project_info["package_managers"].append("go")
             project_info["technologies"].append("go")
@@ -139,17 +439,16 @@ class QAAutomation:
             "test_*.py", "*_test.py"
         ]
         
-        for indicator in test_indicators:
-            if list(project_path.glob(f"**/{indicator}")) or list(project_path.glob(indicator)):
-                project_info["has_tests"] = True
-                break
+        project_info["has_tests"] = self._has_tracked(project_path, test_indicators)
         
         # Check for CI/CD
-        if (project_path / ".github" / "workflows").exists() or (project_path / ".gitlab-ci.yml").exists():
+        if ".gitlab-ci.yml" in top_level or (
+            ".github" in top_level and "workflows" in self.list_entries(project_path / ".github")
+        ):
             project_info["has_ci"] = True
         
         # Check for Docker
-        if (project_path / "Dockerfile").exists() or (project_path / "docker-compose.yml").exists():
+        if "Dockerfile" in top_level or "docker-compose.yml" in top_level:
             project_info["has_docker"] = True
             project_info["technologies"].append("docker")
         
@@ -171,12 +470,12 @@ class QAAutomation:
         if primary_lang == "javascript" or "typescript" in project_info["technologies"]:
             # Try ESLint
             if (project_path / ".eslintrc.json").exists() or (project_path / ".eslintrc.js").exists():
-                result = self.run_command(["npx", "eslint", ".", "--format", "json"], project_path)
+                result = self.run_command(CMD_ESLINT, project_path)
                 lint_results["tool_used"] = "eslint"
                 
                 if result["success"] or result["returncode"] == 1:  # ESLint exits 1 with errors
                     try:
-                        eslint_output = json.loads(result["stdout"])
+                        eslint_output = _json_loads(result["stdout"])
                         for file_result in eslint_output:
                             for message in file_result.get("messages", []):
                                 if message["severity"] == 2:
@@ -203,11 +502,11 @@ class QAAutomation:
         
         elif primary_lang == "python":
             # Try ruff first (fastest)
-            result = self.run_command(["ruff", "check", ".", "--output-format", "json"], project_path)
+            result = self.run_command(CMD_RUFF, project_path)
             if result["success"] or result["returncode"] == 1:
                 lint_results["tool_used"] = "ruff"
                 try:
-                    ruff_output = json.loads(result["stdout"])
+                    ruff_output = _json_loads(result["stdout"])
                     for issue in ruff_output:
                         lint_results["errors"] += 1  # Ruff treats most as errors
                         lint_results["issues"].append({
@@ -226,7 +525,7 @@ class QAAutomation:
             
             # Fallback to flake8
             elif (project_path / "setup.cfg").exists() or (project_path / ".flake8").exists():
-                result = self.run_command(["flake8", ".", "--format=json"], project_path)
+                result = self.run_command(CMD_FLAKE8, project_path)
                 lint_results["tool_used"] = "flake8"
                 # Parse flake8 output (simplified)
                 lint_results["errors"] = result["stdout"].count("\n") if result["stdout"] else 0
@@ -251,90 +550,80 @@ class QAAutomation:
         
         # NPM/Node.js security audit
         if primary_lang == "javascript" and (project_path / "package.json").exists():
-            result = self.run_command(["npm", "audit", "--json"], project_path)
-            if result["success"] or result.get("returncode") in [0, 1]:
+            status = {}
+            audit_counts = {}
+            try:
+                for key, value in self.stream_json_output(
+                    CMD_NPM_AUDIT, "vulnerabilities", status, project_path, pairs=True
+                ):
+                    if key in NPM_AUDIT_COUNTERS:
+                        audit_counts[NPM_AUDIT_COUNTERS[key]] = value
+            except:
+                pass
+            if status.get("returncode") in [0, 1]:
                 security_results["tools_used"].append("npm-audit")
-                try:
-                    audit_data = json.loads(result["stdout"])
-                    if "vulnerabilities" in audit_data:
-                        vuln_data = audit_data["vulnerabilities"]
-                        security_results["vulnerabilities"] = vuln_data.get("total", 0)
-                        security_results["critical_vulnerabilities"] = vuln_data.get("critical", 0)
-                        security_results["high_vulnerabilities"] = vuln_data.get("high", 0)
-                        security_results["medium_vulnerabilities"] = vuln_data.get("moderate", 0)
-                        security_results["low_vulnerabilities"] = vuln_data.get("low", 0)
-                except:
-                    pass
+                security_results.update(audit_counts)
         
         # Python security scanning
         elif primary_lang == "python":
             # Try safety for known vulnerabilities
-            result = self.run_command(["safety", "check", "--json"], project_path)
-            if result["success"] or result.get("returncode") in [0, 1]:
+            status = {}
+            safety_counts = dict.fromkeys(["vulnerabilities", "low_vulnerabilities", *SEVERITY_COUNTERS.values()], 0)
+            try:
+                for vuln in self.stream_json_output(CMD_SAFETY, "item", status, project_path):
+                    safety_counts["vulnerabilities"] += 1
+                    severity = vuln.get("severity", "medium").lower()
+                    safety_counts[SEVERITY_COUNTERS.get(severity, "low_vulnerabilities")] += 1
+            except:
+                pass
+            if status.get("returncode") in [0, 1]:
                 security_results["tools_used"].append("safety")
-                try:
-                    safety_data = json.loads(result["stdout"])
-                    security_results["vulnerabilities"] = len(safety_data)
-                    for vuln in safety_data:
-                        severity = vuln.get("severity", "medium").lower()
-                        if severity == "critical":
-                            security_results["critical_vulnerabilities"] += 1
-                        elif severity == "high":
-                            security_results["high_vulnerabilities"] += 1
-                        elif severity == "medium":
-                            security_results["medium_vulnerabilities"] += 1
-                        else:
-                            security_results["low_vulnerabilities"] += 1
-                except:
-                    pass
+                security_results.update(safety_counts)
             
             # Try bandit for code analysis
-            result = self.run_command(["bandit", "-r", ".", "-f", "json"], project_path)
-            if result["success"] or result.get("returncode") in [0, 1]:
+            status = {}
+            bandit_issues = []
+            try:
+                for issue in self.stream_json_output(CMD_BANDIT, "results.item", status, project_path):
+                    bandit_issues.append({
+                        "file": issue["filename"],
+                        "line": issue["line_number"],
+                        "severity": issue["issue_severity"].lower(),
+                        "confidence": issue["issue_confidence"].lower(),
+                        "message": issue["issue_text"],
+                        "rule": issue["test_id"]
+                    })
+            except:
+                pass
+            if status.get("returncode") in [0, 1]:
                 security_results["tools_used"].append("bandit")
-                try:
-                    bandit_data = json.loads(result["stdout"])
-                    for issue in bandit_data.get("results", []):
-                        security_results["issues"].append({
-                            "file": issue["filename"],
-                            "line": issue["line_number"],
-                            "severity": issue["issue_severity"].lower(),
-                            "confidence": issue["issue_confidence"].lower(),
-                            "message": issue["issue_text"],
-                            "rule": issue["test_id"]
-                        })
-                except:
-                    pass
+                security_results["issues"].extend(bandit_issues)
         
-        # Secret scanning (basic pattern matching)
-        secret_patterns = [
-            r'api[_-]?key["\s]*[:=]["\s]*[a-zA-Z0-9]+',
-            r'secret[_-]?key["\s]*[:=]["\s]*[a-zA-Z0-9]+',
-            r'password["\s]*[:=]["\s]*[a-zA-Z0-9]+',
-            r'aws[_-]?access[_-]?key["\s]*[:=]["\s]*[A-Z0-9]+',
-            r'private[_-]?key["\s]*[:=]',
-        ]
-        
-        import re
+        # Secret scanning (basic pattern matching on raw bytes)
         secret_count = 0
         
-        for file_path in project_path.rglob("*"):
-            if file_path.is_file() and file_path.suffix in [".js", ".ts", ".py", ".json", ".yml", ".yaml", ".env"]:
+        file_index = self._build_file_index(project_path)
+        for suffix in SECRET_SCAN_SUFFIXES:
+            for file_path in file_index.get(suffix, []):
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        for pattern in secret_patterns:
-                            if re.search(pattern, content, re.IGNORECASE):
-                                secret_count += 1
-                                security_results["issues"].append({
-                                    "file": str(file_path.relative_to(project_path)),
-                                    "type": "potential_secret",
-                                    "pattern": pattern,
-                                    "severity": "high"
-                                })
-                                break
-                except:
-                    pass
+                    with open(file_path, 'rb') as f:
+                        content = f.read(MAX_SECRET_SCAN_BYTES + 1)
+                except OSError:
+                    continue
+                
+                # Skip oversized files and binaries (NUL byte near the start, as git does)
+                if len(content) > MAX_SECRET_SCAN_BYTES or b"\0" in content[:BINARY_SNIFF_BYTES]:
+                    continue
+                
+                match = self._secret_re.search(content)
+                if match:
+                    secret_count += 1
+                    security_results["issues"].append({
+                        "file": os.path.relpath(file_path, project_path),
+                        "type": "potential_secret",
+                        "pattern": SECRET_PATTERNS[match.lastindex - 1].decode("ascii"),
+                        "severity": "high"
+                    })
         
         security_results["secret_leaks"] = secret_count
         if secret_count > 0:
@@ -358,11 +647,11 @@ class QAAutomation:
         
         if primary_lang == "javascript" and (project_path / "package.json").exists():
             # Try Jest with coverage
-            result = self.run_command(["npm", "test", "--", "--coverage", "--json"], project_path)
+            result = self.run_command(CMD_NPM_TEST, project_path)
             if result["success"]:
                 coverage_results["test_suite_run"] = True
                 try:
-                    test_data = json.loads(result["stdout"])
+                    test_data = _json_loads(result["stdout"])
                     coverage_results["tests_passed"] = test_data.get("numPassedTests", 0)
                     coverage_results["tests_failed"] = test_data.get("numFailedTests", 0)
                     coverage_results["tests_skipped"] = test_data.get("numPendingTests", 0)
@@ -370,27 +659,20 @@ class QAAutomation:
                     # Extract coverage info
                     if "coverageMap" in test_data:
                         # Simplified coverage calculation
-                        total_statements = 0
-                        covered_statements = 0
-                        
-                        for file_coverage in test_data["coverageMap"].values():
-                            statements = file_coverage.get("s", {})
-                            total_statements += len(statements)
-                            covered_statements += sum(1 for count in statements.values() if count > 0)
+                        covered_statements, total_statements = _aggregate_statement_coverage(test_data["coverageMap"])
                         
                         if total_statements > 0:
                             coverage_results["coverage_percentage"] = (covered_statements / total_statements) * 100
                 except:
                     # Fallback: parse text output
                     if "All files" in result["stdout"]:
-                        import re
                         coverage_match = re.search(r'All files.*?(\d+\.?\d*)%', result["stdout"])
                         if coverage_match:
                             coverage_results["coverage_percentage"] = float(coverage_match.group(1))
         
         elif primary_lang == "python":
             # Try pytest with coverage
-            result = self.run_command(["pytest", "--cov=.", "--cov-report=json", "--json-report"], project_path)
+            result = self.run_command(CMD_PYTEST, project_path)
             if result["success"]:
                 coverage_results["test_suite_run"] = True
                 
@@ -398,8 +680,8 @@ class QAAutomation:
                 coverage_file = project_path / "coverage.json"
                 if coverage_file.exists():
                     try:
-                        with open(coverage_file, 'r') as f:
-                            cov_data = json.load(f)
+                        with open(coverage_file, 'rb') as f:
+                            cov_data = _json_loads(f.read())
                             coverage_results["coverage_percentage"] = cov_data.get("totals", {}).get("percent_covered", 0)
                     except:
                         pass
@@ -408,8 +690,8 @@ class QAAutomation:
                 test_report_file = project_path / ".report.json"
                 if test_report_file.exists():
                     try:
-                        with open(test_report_file, 'r') as f:
-                            test_data = json.load(f)
+                        with open(test_report_file, 'rb') as f:
+                            test_data = _json_loads(f.read())
                             summary = test_data.get("summary", {})
                             coverage_results["tests_passed"] = summary.get("passed", 0)
                             coverage_results["tests_failed"] = summary.get("failed", 0)
@@ -434,10 +716,10 @@ class QAAutomation:
         
         if primary_lang == "javascript" or "typescript" in project_info["technologies"]:
             # Use complexity-report for JavaScript/TypeScript
-            result = self.run_command(["npx", "complexity-report", "--output", "json", "src/**/*.{js,ts}"], project_path)
+            result = self.run_command(CMD_COMPLEXITY_REPORT, project_path)
             if result["success"]:
                 try:
-                    complexity_data = json.loads(result["stdout"])
+                    complexity_data = _json_loads(result["stdout"])
                     analysis_results["complexity_score"] = complexity_data.get("maintainability", 0)
                     
                     # Count high complexity functions
@@ -449,23 +731,23 @@ class QAAutomation:
                     pass
             
             # Use jscpd for duplication detection
-            result = self.run_command(["npx", "jscpd", ".", "--reporters", "json"], project_path)
+            result = self.run_command(CMD_JSCPD, project_path)
             if result["success"]:
                 try:
                     jscpd_file = project_path / "report" / "jscpd-report.json"
                     if jscpd_file.exists():
-                        with open(jscpd_file, 'r') as f:
-                            duplication_data = json.load(f)
+                        with open(jscpd_file, 'rb') as f:
+                            duplication_data = _json_loads(f.read())
                             analysis_results["duplication_percentage"] = duplication_data.get("statistics", {}).get("percentage", 0)
                 except:
                     pass
         
         elif primary_lang == "python":
             # Use radon for complexity analysis
-            result = self.run_command(["radon", "cc", ".", "--json"], project_path)
+            result = self.run_command(CMD_RADON, project_path)
             if result["success"]:
                 try:
-                    radon_data = json.loads(result["stdout"])
+                    radon_data = _json_loads(result["stdout"])
                     total_complexity = 0
                     high_complexity_count = 0
                     
@@ -503,8 +785,8 @@ class QAAutomation:
         # Check if it's a web project
         if (project_path / "package.json").exists():
             try:
-                with open(project_path / "package.json", 'r') as f:
-                    package_data = json.load(f)
+                with open(project_path / "package.json", 'rb') as f:
+                    package_data = _json_loads(f.read())
                     
                 # Check for web frameworks
                 deps = {**package_data.get("dependencies", {}), **package_data.get("devDependencies", {})}
@@ -522,10 +804,58 @@ class QAAutomation:
         
         return performance_results
     
+    def get_report_cache_key(self, project_path: Path) -> Optional[str]:
+        """Compute the report cache key, or None if the project can't be cached"""
+        if not (project_path / ".git").exists():
+            return None
+        
+        head = self.run_command(CMD_GIT_HEAD, project_path)
+        if not head["success"]:
+            return None
+        
+        # A dirty worktree isn't described by HEAD, so never serve it from cache.
+        # Output left behind by a previous QA run doesn't count.
+        status = self.run_command(CMD_GIT_STATUS, project_path)
+        if not status["success"] or status["stdout"]:
+            return None
+        
+        key_parts = [str(project_path).encode("utf-8"), head["stdout"].encode("utf-8")]
+        for lock_name in ["package-lock.json", "poetry.lock"]:
+            lock_file = project_path / lock_name
+            key_parts.append(lock_file.read_bytes() if lock_file.exists() else b"")
+        
+        return hashlib.blake2b(b"|".join(key_parts)).hexdigest()
+    
+    def load_cached_report(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached QA report if it exists and is within the TTL"""
+        try:
+            if time.time() - cache_file.stat().st_mtime >= self._cache_ttl:
+                return None
+            return _json_loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+    
+    def save_cached_report(self, cache_file: Path, qa_report: Dict[str, Any]):
+        """Store a QA report in the cache, dropping older entries for the project"""
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        for stale_file in cache_file.parent.glob("*.json"):
+            if stale_file != cache_file:
+                stale_file.unlink(missing_ok=True)
+        cache_file.write_bytes(_json_dumps(qa_report))
+    
     def generate_qa_report(self, project_path: Path) -> Dict[str, Any]:
         """Generate comprehensive QA report for a project"""
         project_name = project_path.name
         
+        cache_key = self.get_report_cache_key(project_path)
+        cache_file = self.cache_dir / project_name / f"{cache_key}.json" if cache_key else None
+        
+        if cache_file and self.use_cache:
+            cached_report = self.load_cached_report(cache_file)
+            if cached_report is not None:
+                print(f"♻️  Using cached QA report for {project_name}")
+                return cached_report
+        
         print(f"🔍 Running QA analysis for {project_name}...")
         
         # Detect project type
@@ -554,68 +884,31 @@ class QAAutomation:
         gates_passed = 0
         total_gates = len(self.qa_config["quality_gates"])
         
-        # Test coverage gate
-        if qa_report["testing"]["coverage_percentage"] >= self.qa_config["quality_gates"]["test_coverage_minimum"]:
-            score += 25
-            gates_passed += 1
-        else:
-            qa_report["recommendations"].append({
-                "priority": "high",
-                "category": "testing",
-                "issue": f"Test coverage is {qa_report['testing']['coverage_percentage']:.1f}%, need {self.qa_config['quality_gates']['test_coverage_minimum']}%",
-                "action": "Add more unit tests and integration tests"
-            })
-        
-        # Linting gate
-        if qa_report["linting"]["errors"] <= self.qa_config["quality_gates"]["lint_error_tolerance"]:
-            score += 25
-            gates_passed += 1
-        else:
-            qa_report["recommendations"].append({
-                "priority": "medium",
-                "category": "code_quality",
-                "issue": f"{qa_report['linting']['errors']} linting errors found",
-                "action": f"Run {qa_report['linting']['tool_used']} --fix to auto-fix {qa_report['linting']['auto_fixable']} issues"
-            })
-        
-        # Security gate
-        if qa_report["security"]["critical_vulnerabilities"] <= self.qa_config["quality_gates"]["security_vulnerability_tolerance"]:
-            score += 25
-            gates_passed += 1
-        else:
-            qa_report["recommendations"].append({
-                "priority": "critical",
-                "category": "security",
-                "issue": f"{qa_report['security']['critical_vulnerabilities']} critical vulnerabilities found",
-                "action": "Update dependencies and fix security issues immediately"
-            })
-        
-        # Code complexity gate
-        if qa_report["code_analysis"]["complexity_issues"] <= self.qa_config["quality_gates"]["complexity_threshold"]:
-            score += 25
-            gates_passed += 1
-        else:
-            qa_report["recommendations"].append({
-                "priority": "medium",
-                "category": "maintainability",
-                "issue": f"{qa_report['code_analysis']['complexity_issues']} overly complex functions",
-                "action": "Refactor complex functions to improve maintainability"
-            })
+        thresholds = self.qa_config["quality_gates"]
+        for section, metric, threshold_key, passes, weight, priority, category, issue, action in QUALITY_GATES:
+            threshold = thresholds[threshold_key]
+            if passes(qa_report[section][metric], threshold):
+                score += weight
+                gates_passed += 1
+            else:
+                qa_report["recommendations"].append({
+                    "priority": priority,
+                    "category": category,
+                    "issue": issue.format(report=qa_report, threshold=threshold),
+                    "action": action.format(report=qa_report, threshold=threshold)
+                })
         
         qa_report["quality_score"] = score
         qa_report["passed_gates"] = gates_passed
         
         # Assign grade
-        if score >= 90:
-            qa_report["quality_grade"] = "A"
-        elif score >= 80:
-            qa_report["quality_grade"] = "B"
-        elif score >= 70:
-            qa_report["quality_grade"] = "C"
-        elif score >= 60:
-            qa_report["quality_grade"] = "D"
-        else:
-            qa_report["quality_grade"] = "F"
+        qa_report["quality_grade"] = GRADES[bisect.bisect_right(GRADE_THRESHOLDS, score)]
+        
+        # The file index is only needed while this project's checks run
+        self._file_index.pop(project_path, None)
+        
+        if cache_file:
+            self.save_cached_report(cache_file, qa_report)
         
         return qa_report
     
@@ -626,39 +919,50 @@ class QAAutomation:
             "projects": {},
             "summary": {
                 "total_projects": 0,
-                "a_grade_projects": 0,
-                "b_grade_projects": 0,
-                "c_grade_projects": 0,
-                "d_grade_projects": 0,
-                "f_grade_projects": 0,
+                "grades": Counter(),  # Projects per quality grade letter
                 "average_score": 0,
                 "total_critical_issues": 0,
                 "total_security_issues": 0
             }
         }
         
+        summary = all_qa_results["summary"]
         total_score = 0
         
-        for project_dir in self.projects_root.iterdir():
-            if project_dir.is_dir() and project_dir.name not in ["admin", ".git", "node_modules"]:
-                qa_report = self.generate_qa_report(project_dir)
+        project_dirs = [
+            project_dir for project_dir in self.projects_root.iterdir()
+            if project_dir.is_dir() and project_dir.name not in ["admin", ".git", "node_modules"]
+        ]
+        
+        # Each project's checks are independent, so run them in parallel worker processes
+        max_workers = max(1, min(len(project_dirs), os.cpu_count() or 1))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            qa_reports = executor.map(
+                _generate_qa_report,
+                map(str, project_dirs),
+                repeat(self.use_cache),
+                repeat(self._cache_ttl),
+                chunksize=1
+            )
+            
+            for project_dir, qa_report in zip(project_dirs, qa_reports):
                 all_qa_results["projects"][project_dir.name] = qa_report
                 
                 # Update summary
-                all_qa_results["summary"]["total_projects"] += 1
+                summary["total_projects"] += 1
                 total_score += qa_report["quality_score"]
                 
-                grade = qa_report["quality_grade"]
-                all_qa_results["summary"][f"{grade.lower()}_grade_projects"] += 1
+                summary["grades"][qa_report["quality_grade"]] += 1
                 
                 # Count critical issues
-                critical_recs = [r for r in qa_report["recommendations"] if r["priority"] == "critical"]
-                all_qa_results["summary"]["total_critical_issues"] += len(critical_recs)
-                all_qa_results["summary"]["total_security_issues"] += qa_report["security"]["critical_vulnerabilities"]
+                summary["total_critical_issues"] += sum(
+                    1 for r in qa_report["recommendations"] if r["priority"] == "critical"
+                )
+                summary["total_security_issues"] += qa_report["security"]["critical_vulnerabilities"]
         
         # Calculate average score
-        if all_qa_results["summary"]["total_projects"] > 0:
-            all_qa_results["summary"]["average_score"] = total_score / all_qa_results["summary"]["total_projects"]
+        if summary["total_projects"] > 0:
+            summary["average_score"] = total_score / summary["total_projects"]
         
         return all_qa_results
     
@@ -666,15 +970,18 @@ class QAAutomation:
         """Save QA results"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # Encode once; the full report and the latest copy are identical
+        payload = _json_dumps(results, indent=True)
+        
         # Save full results
         results_file = self.qa_dir / "reports" / f"qa_report_{timestamp}.json"
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(results_file, 'wb', buffering=REPORT_WRITE_BUFFER) as f:
+            f.write(payload)
         
         # Save latest for quick access
         latest_file = self.qa_dir / "latest_qa_report.json"
-        with open(latest_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(latest_file, 'wb', buffering=REPORT_WRITE_BUFFER) as f:
+            f.write(payload)
         
         # Save critical issues
         critical_issues = []
@@ -690,11 +997,15 @@ class QAAutomation:
         
         if critical_issues:
             critical_file = self.qa_dir / "reports" / f"critical_issues_{timestamp}.json"
-            with open(critical_file, 'w') as f:
-                json.dump(critical_issues, f, indent=2)
+            with open(critical_file, 'wb', buffering=REPORT_WRITE_BUFFER) as f:
+                f.write(_json_dumps(critical_issues, indent=True))
         
         return results_file, latest_file
 
+def _generate_qa_report(project_path: str, use_cache: bool = True, cache_ttl: int = QA_CACHE_TTL) -> Dict[str, Any]:
+    """Process-pool entry point: generate one project's QA report in a worker"""
+    return QAAutomation(use_cache=use_cache, cache_ttl=cache_ttl).generate_qa_report(Path(project_path))
+
 def main():
     import argparse
     
@@ -704,10 +1015,11 @@ def main():
     parser.add_argument("--report", action="store_true", help="Generate QA report")
     parser.add_argument("--fix", action="store_true", help="Auto-fix issues where possible")
     parser.add_argument("--json", action="store_true", help="Output JSON format")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached reports and re-run all checks")
     
     args = parser.parse_args()
     
-    qa = QAAutomation()
+    qa = QAAutomation(use_cache=not args.no_cache)
     
     if args.project:
         project_path = Path(PROJECTS_ROOT) / args.project
@@ -715,7 +1027,7 @@ def main():
             qa_report = qa.generate_qa_report(project_path)
             
             if args.json:
-                print(json.dumps(qa_report, indent=2))
+                print(_json_dumps(qa_report, indent=True).decode('utf-8'))
             else:
                 print(f"QA Report for {qa_report['project']}")
                 print(f"Quality Score: {qa_report['quality_score']}/100 (Grade: {qa_report['quality_grade']})")
@@ -739,7 +1051,7 @@ def main():
         results_file, latest_file = qa.save_qa_results(results)
         
         if args.json:
-            print(json.dumps(results, indent=2))
+            print(_json_dumps(results, indent=True).decode('utf-8'))
         else:
             summary = results["summary"]
             print("📊 QA SUMMARY")
@@ -747,11 +1059,8 @@ def main():
             print(f"Total Projects: {summary['total_projects']}")
             print(f"Average Score: {summary['average_score']:.1f}/100")
             print(f"Grade Distribution:")
-            print(f"  A: {summary['a_grade_projects']} projects")
-            print(f"  B: {summary['b_grade_projects']} projects") 
-            print(f"  C: {summary['c_grade_projects']} projects")
-            print(f"  D: {summary['d_grade_projects']} projects")
-            print(f"  F: {summary['f_grade_projects']} projects")
+            for g in "ABCDF":
+                print(f"  {g}: {summary['grades'][g]} projects")
             print(f"Critical Issues: {summary['total_critical_issues']}")
             print(f"Security Issues: {summary['total_security_issues']}")
             
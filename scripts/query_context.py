@@ -4,45 +4,203 @@ Context Query System
 Query and summarize past context, decisions, and progress
 """
 
+import io
 import os
+import re
+import sys
 import json
+import itertools
+import functools
 from datetime import datetime, timedelta
 from pathlib import Path
 import argparse
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional; used for parsing when orjson is missing
+    msgspec = None
 
 ADMIN_ROOT = "/Users/MAC/Documents/projects/admin"
 CONTEXT_DIR = os.path.join(ADMIN_ROOT, "context")
 DECISIONS_DIR = os.path.join(ADMIN_ROOT, "decisions")
+CONTEXT_LOG_NAME = "context.jsonl"  # Append-only snapshot log written by capture_context.py
+DECISIONS_INDEX_NAME = "decisions.index"  # project -> daily files, written by log_decision.py
+JSON_LOAD_WORKERS = 8  # Threads used to read/parse history files concurrently
+LOG_SCAN_BYTES = 64 * 1024  # Below this span the context log is scanned linearly for the cutoff
+_LOG_LINE_PREFIX = b'{"timestamp":"'  # Every context log line starts with its timestamp
+_CRIT_RE = re.compile(r"FIXME|CRITICAL").search  # TODOs surfaced in the executive summary
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize obj to 2-space indented JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson or msgspec when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+def _ts_key(name: str) -> str:
+    """Sortable YYYYMMDD_HHMMSS stamp sliced out of a context_YYYYMMDD_HHMMSS.json name"""
+    return name[8:23]
+
+def _iso_ts_key(timestamp: str) -> str:
+    """The _ts_key stamp for an ISO timestamp, e.g. 2025-08-16T16:12:01.5 -> 20250816_161201"""
+    return timestamp[:19].replace("-", "").replace(":", "").replace("T", "_")
+
+def _seek_log_cutoff(f, size: int, cutoff: bytes):
+    """Position f at or before the first context log line not older than cutoff.
+    
+    Lines are appended in timestamp order, so the start is found by bisecting
+    byte offsets instead of reading every older line.
+    """
+    lo, hi = 0, size
+    while hi - lo > LOG_SCAN_BYTES:
+        mid = (lo + hi) // 2
+        f.seek(mid)
+        f.readline()  # Skip to the start of the next whole line
+        line = f.readline()
+        if line.startswith(_LOG_LINE_PREFIX) and line < cutoff:
+            lo = mid  # Everything up to that line is older than the cutoff
+        else:
+            hi = mid
+    f.seek(lo)
+    if lo:
+        f.readline()  # Partial line, older than the cutoff
+
+@functools.lru_cache(maxsize=256)
+def _load_json_file(path: str, mtime_ns: int) -> Any:
+    """Load a JSON file, memoized on (path, mtime) so unchanged files are parsed once.
+    
+    The parsed object is shared between callers and must not be mutated.
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
 
 class ContextQuery:
     def __init__(self):
         self.context_dir = Path(CONTEXT_DIR)
         self.decisions_dir = Path(DECISIONS_DIR)
+        self._bad_files = set()  # (path, mtime_ns) of files that failed to load
+        
+    def scan_json_files(self, directory: Path, prefix: str):
+        """Yield DirEntry objects for the <prefix>*.json files in a directory"""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith(prefix) and entry.name.endswith(".json"):
+                        yield entry
+        except FileNotFoundError:
+            return
+    
+    def load_json_files(self, entries: List[os.DirEntry]) -> List[Any]:
+        """Load JSON files concurrently, in order; unreadable files come back as None"""
+        def load(entry: os.DirEntry) -> Any:
+            try:
+                key = (entry.path, entry.stat().st_mtime_ns)
+            except OSError:
+                return None
+            if key in self._bad_files:
+                return None  # Known bad and unchanged since; don't re-read it
+            try:
+                return _load_json_file(*key)
+            except (OSError, ValueError):
+                self._bad_files.add(key)
+                return None
+        
+        if len(entries) < 2:
+            return [load(entry) for entry in entries]
         
+        with ThreadPoolExecutor(max_workers=JSON_LOAD_WORKERS) as executor:
+            return list(executor.map(load, entries))
+    
     def get_latest_context(self) -> Dict[str, Any]:
         """Get the most recent context file"""
-        context_files = sorted(self.context_dir.glob("context_*.json"))
-        if context_files:
-            with open(context_files[-1], 'r') as f:
-                return json.load(f)
+        # Timestamped names sort chronologically, so one O(N) pass finds the newest
+        latest = max(self.scan_json_files(self.context_dir, "context_"), key=lambda entry: _ts_key(entry.name), default=None)
+        if latest is not None:
+            return _load_json_file(latest.path, latest.stat().st_mtime_ns)
         return {}
     
+    def read_context_log(self, cutoff_date: datetime) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """(first logged timestamp, snapshots taken since cutoff_date) from the context log, or None if there is no log"""
+        log_path = self.context_dir / CONTEXT_LOG_NAME
+        try:
+            f = open(log_path, 'rb')
+        except FileNotFoundError:
+            return None
+        
+        # Lines are appended in capture order and written compactly with the
+        # timestamp first, so older lines are skipped on a prefix compare
+        # without being parsed, and everything after the first hit is kept
+        cutoff_iso = cutoff_date.isoformat()
+        cutoff = _LOG_LINE_PREFIX + cutoff_iso.encode()
+        contexts = []
+        with f:
+            first_line = f.readline()
+            first_timestamp = ""
+            if first_line.startswith(_LOG_LINE_PREFIX):
+                first_timestamp = first_line[len(_LOG_LINE_PREFIX):].split(b'"', 1)[0].decode("utf-8", "replace")
+            
+            stat = os.fstat(f.fileno())
+            if stat.st_mtime < cutoff_date.timestamp():
+                return first_timestamp, contexts  # Nothing has been appended since the cutoff
+            
+            _seek_log_cutoff(f, stat.st_size, cutoff)
+            for line in f:
+                if not contexts and line.startswith(_LOG_LINE_PREFIX) and line < cutoff:
+                    continue
+                try:
+                    context = _json_loads(line)
+                except ValueError:
+                    continue  # Torn final line from an interrupted append
+                if contexts or context.get("timestamp", "") >= cutoff_iso:
+                    contexts.append(context)
+        
+        return first_timestamp, contexts
+    
     def get_context_history(self, days_back: int = 7) -> List[Dict[str, Any]]:
         """Get context history for the past N days"""
         cutoff_date = datetime.now() - timedelta(days=days_back)
-        contexts = []
         
-        for context_file in sorted(self.context_dir.glob("context_*.json")):
-            file_date = datetime.fromtimestamp(context_file.stat().st_mtime)
-            if file_date >= cutoff_date:
-                try:
-                    with open(context_file, 'r') as f:
-                        contexts.append(json.load(f))
-                except:
-                    pass
+        # Files are named context_YYYYMMDD_HHMMSS.json, so the cutoff is a plain string
+        # comparison on the sliced stamp: no datetime parsing, and rejected files never
+        # need a stat() call or a sort
+        cutoff_key = cutoff_date.strftime("%Y%m%d_%H%M%S")
+        
+        # Prefer the append-only log: one sequential read instead of N opens
+        logged = self.read_context_log(cutoff_date)
+        if logged is not None:
+            first_timestamp, logged_contexts = logged
+            if logged_contexts and logged_contexts[0].get("timestamp") != first_timestamp:
+                return logged_contexts  # The window starts inside the log
+            # The window reaches back past the log's first entry: add any snapshot
+            # files captured before the log existed
+            end_key = _iso_ts_key(first_timestamp) if first_timestamp else None
+        else:
+            logged_contexts = []
+            end_key = None
+        
+        context_files = sorted(
+            (entry for entry in self.scan_json_files(self.context_dir, "context_")
+             if _ts_key(entry.name) >= cutoff_key and (end_key is None or _ts_key(entry.name) < end_key)),
+            key=lambda entry: _ts_key(entry.name)
+        )
         
+        contexts = [context for context in self.load_json_files(context_files) if context is not None]
+        contexts.extend(logged_contexts)
         return contexts
     
     def get_project_summary(self, project_name: str) -> Dict[str, Any]:
@@ -53,19 +211,23 @@ class ContextQuery:
             return {"error": f"Project '{project_name}' not found"}
         
         project_data = latest_context["projects"][project_name]
+        git_info = project_data.get("git_info") or {}
+        modified = git_info.get("modified_files") or ()
+        untracked = git_info.get("untracked_files") or ()
         
         # Get historical data
         history = self.get_context_history(days_back=7)
-        commit_history = []
+        commits_last_week = 0
         todo_trend = []
         
         for ctx in history:
-            if project_name in ctx.get("projects", {}):
-                proj = ctx["projects"][project_name]
-                commit_history.extend(proj.get("git_info", {}).get("commits", []))
+            proj = (ctx.get("projects") or {}).get(project_name)
+            if proj is not None:
+                proj_git_info = proj.get("git_info") or {}
+                commits_last_week += len(proj_git_info.get("commits") or ())
                 todo_trend.append({
                     "date": ctx["timestamp"],
-                    "count": len(proj.get("todos", []))
+                    "count": len(proj.get("todos") or ())
                 })
         
         summary = {
@@ -75,12 +237,12 @@ class ContextQuery:
                 "directories": project_data.get("directory_count", 0),
                 "size_mb": round(project_data.get("size_bytes", 0) / (1024 * 1024), 2),
                 "technologies": project_data.get("technologies", []),
-                "current_branch": project_data.get("git_info", {}).get("current_branch"),
-                "modified_files": len(project_data.get("git_info", {}).get("modified_files", [])),
-                "untracked_files": len(project_data.get("git_info", {}).get("untracked_files", []))
+                "current_branch": git_info.get("current_branch"),
+                "modified_files": len(modified),
+                "untracked_files": len(untracked)
             },
             "recent_activity": {
-                "commits_last_week": len(commit_history),
+                "commits_last_week": commits_last_week,
                 "recent_changes": project_data.get("recent_changes", [])[:10],
                 "active_todos": len(project_data.get("todos", []))
             },
@@ -91,22 +253,47 @@ class ContextQuery:
         
         return summary
     
+    def load_decisions_index(self) -> Optional[Dict[str, Any]]:
+        """Load the project -> decision files index, or None if it is missing or unreadable"""
+        index_path = os.path.join(self.decisions_dir, DECISIONS_INDEX_NAME)
+        try:
+            index = _load_json_file(index_path, os.stat(index_path).st_mtime_ns)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(index, dict) or "indexed_from" not in index or "projects" not in index:
+            return None
+        return index
+    
     def get_all_decisions(self, days_back: int = 7, project: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all decisions from the past N days"""
         cutoff_date = datetime.now() - timedelta(days=days_back)
         all_decisions = []
         
-        for decision_file in self.decisions_dir.glob("decisions_*.json"):
-            file_date = datetime.fromtimestamp(decision_file.stat().st_mtime)
-            if file_date >= cutoff_date:
-                try:
-                    with open(decision_file, 'r') as f:
-                        decisions = json.load(f)
-                        for decision in decisions:
-                            if project is None or decision.get("project") == project:
-                                all_decisions.append(decision)
-                except:
-                    pass
+        # Daily files are named decisions_YYYYMMDD.json; compare names against the cutoff day
+        cutoff_name = cutoff_date.strftime("decisions_%Y%m%d")
+        decision_files = [
+            entry for entry in self.scan_json_files(self.decisions_dir, "decisions_")
+            if entry.name >= cutoff_name
+        ]
+        
+        # With a project filter, the index lets whole files be skipped unparsed
+        if project is not None:
+            index = self.load_decisions_index()
+            if index is not None:
+                indexed_from = index["indexed_from"]
+                project_files = set(index["projects"].get(project, ()))
+                decision_files = [
+                    entry for entry in decision_files
+                    if entry.name <= indexed_from or entry.name in project_files
+                ]
+        
+        for decisions in self.load_json_files(decision_files):
+            try:
+                for decision in decisions:
+                    if project is None or decision.get("project") == project:
+                        all_decisions.append(decision)
+            except (TypeError, AttributeError):
+                pass  # Unreadable (None) or not a list of decision dicts
         
         # Sort by timestamp
         all_decisions.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
@@ -114,18 +301,16 @@ class ContextQuery:
     
     def get_progress_report(self, project: Optional[str] = None) -> Dict[str, Any]:
         """Generate a progress report"""
-        progress_files = sorted(self.decisions_dir.glob("progress_*.json"))
+        progress_files = sorted(self.scan_json_files(self.decisions_dir, "progress_"), key=lambda entry: entry.name)
         all_progress = []
         
-        for progress_file in progress_files:
+        for progress_entries in self.load_json_files(progress_files):
             try:
-                with open(progress_file, 'r') as f:
-                    progress_entries = json.load(f)
-                    for entry in progress_entries:
-                        if project is None or entry.get("project") == project:
-                            all_progress.append(entry)
-            except:
-                pass
+                for entry in progress_entries:
+                    if project is None or entry.get("project") == project:
+                        all_progress.append(entry)
+            except (TypeError, AttributeError):
+                pass  # Unreadable (None) or not a list of progress dicts
         
         # Group by project and task
         report = defaultdict(lambda: defaultdict(list))
@@ -151,86 +336,113 @@ class ContextQuery:
         
         return summary
     
-    def generate_executive_summary(self) -> str:
-        """Generate an executive summary of all projects"""
-        context = self.get_latest_context()
-        decisions = self.get_all_decisions(days_back=1)
-        progress = self.get_progress_report()
-        
-        summary_lines = [
-            "=" * 60,
-            "PROJECTS EXECUTIVE SUMMARY",
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "=" * 60,
-            "",
-            "## OVERVIEW",
-            f"Total Projects: {context.get('summary', {}).get('total_projects', 0)}",
-            f"Active Projects: {context.get('summary', {}).get('active_projects', 0)}",
-            f"Recent Commits: {context.get('summary', {}).get('total_commits', 0)}",
-            f"Open TODOs: {context.get('summary', {}).get('total_todos', 0)}",
-            "",
-            "## RECENT ACTIVITY"
-        ]
-        
-        # Add recent commits by project
-        for project_name, project_data in context.get("projects", {}).items():
-            commits = project_data.get("git_info", {}).get("commits", [])
+    def _iter_overview(self, context: Dict[str, Any]):
+        """Yield the summary header and headline numbers"""
+        overview = context.get("summary") or {}
+        yield "=" * 60 + "\n"
+        yield "PROJECTS EXECUTIVE SUMMARY\n"
+        yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        yield "=" * 60 + "\n"
+        yield "\n"
+        yield "## OVERVIEW\n"
+        yield f"Total Projects: {overview.get('total_projects', 0)}\n"
+        yield f"Active Projects: {overview.get('active_projects', 0)}\n"
+        yield f"Recent Commits: {overview.get('total_commits', 0)}\n"
+        yield f"Open TODOs: {overview.get('total_todos', 0)}\n"
+    
+    def _iter_recent_commits(self, projects: Dict[str, Any]):
+        """Yield the last 3 commits of each project"""
+        yield "\n"
+        yield "## RECENT ACTIVITY\n"
+        for project_name, project_data in projects.items():
+            git_info = project_data.get("git_info") or {}
+            commits = git_info.get("commits") or ()
             if commits:
-                summary_lines.append(f"\n### {project_name}")
+                yield f"\n### {project_name}\n"
                 for commit in commits[:3]:  # Show last 3 commits
-                    summary_lines.append(f"  - {commit['message']} ({commit['author']})")
-        
-        # Add recent decisions
+                    yield f"  - {commit['message']} ({commit['author']})\n"
+    
+    def _iter_recent_decisions(self):
+        """Yield the last 5 decisions of the past day"""
+        decisions = self.get_all_decisions(days_back=1)
         if decisions:
-            summary_lines.extend([
-                "",
-                "## RECENT DECISIONS (Last 24 hours)"
-            ])
+            yield "\n"
+            yield "## RECENT DECISIONS (Last 24 hours)\n"
             for decision in decisions[:5]:  # Show last 5 decisions
-                summary_lines.append(f"  - [{decision['category']}] {decision['title']}")
+                yield f"  - [{decision['category']}] {decision['title']}\n"
                 if decision.get('project'):
-                    summary_lines.append(f"    Project: {decision['project']}")
-        
-        # Add progress summary
+                    yield f"    Project: {decision['project']}\n"
+    
+    def _iter_progress(self):
+        """Yield the latest status of every tracked task"""
+        progress = self.get_progress_report()
         if progress:
-            summary_lines.extend([
-                "",
-                "## PROJECT PROGRESS"
-            ])
+            yield "\n"
+            yield "## PROJECT PROGRESS\n"
             for project, tasks in progress.items():
                 if tasks:
-                    summary_lines.append(f"\n### {project}")
+                    yield f"\n### {project}\n"
                     for task, info in tasks.items():
                         status_emoji = "✅" if info['status'] == 'completed' else "🔄" if info['status'] == 'in_progress' else "⏸️"
-                        summary_lines.append(f"  {status_emoji} {task}: {info['completion']}% complete")
-        
-        # Add critical TODOs
-        critical_todos = []
-        for project_name, project_data in context.get("projects", {}).items():
-            for todo in project_data.get("todos", []):
-                if "FIXME" in todo["content"] or "CRITICAL" in todo["content"]:
-                    critical_todos.append({
+                        yield f"  {status_emoji} {task}: {info['completion']}% complete\n"
+    
+    def _critical_todos(self, projects: Dict[str, Any]):
+        """Lazily yield FIXME/CRITICAL TODOs across all projects"""
+        for project_name, project_data in projects.items():
+            for todo in project_data.get("todos") or ():
+                if _CRIT_RE(todo["content"]):
+                    yield {
                         "project": project_name,
                         "file": todo["file"],
                         "line": todo["line"],
                         "content": todo["content"]
-                    })
-        
-        if critical_todos:
-            summary_lines.extend([
-                "",
-                "## CRITICAL TODOs"
-            ])
-            for todo in critical_todos[:10]:  # Show top 10
-                summary_lines.append(f"  - [{todo['project']}] {todo['file']}:{todo['line']}")
-                summary_lines.append(f"    {todo['content'][:80]}...")
-        
-        summary_lines.extend([
-            "",
-            "=" * 60
-        ])
-        
-        return "\n".join(summary_lines)
+                    }
+    
+    def _iter_critical_todos(self, projects: Dict[str, Any]):
+        """Yield the first 10 critical TODOs; the scan stops once they are found"""
+        first = True
+        for todo in itertools.islice(self._critical_todos(projects), 10):  # Show top 10
+            if first:
+                yield "\n"
+                yield "## CRITICAL TODOs\n"
+                first = False
+            yield f"  - [{todo['project']}] {todo['file']}:{todo['line']}\n"
+            yield f"    {todo['content'][:80]}...\n"
+    
+    def iter_executive_summary(self):
+        """Yield the executive summary line by line; later sections load only when reached"""
+        context = self.get_latest_context()
+        projects = context.get("projects") or {}
+        yield from self._iter_overview(context)
+        yield from self._iter_recent_commits(projects)
+        yield from self._iter_recent_decisions()
+        yield from self._iter_progress()
+        yield from self._iter_critical_todos(projects)
+        yield "\n"
+        yield "=" * 60 + "\n"
+    
+    def generate_executive_summary(self) -> str:
+        """Generate an executive summary of all projects"""
+        buf = io.StringIO()
+        buf.writelines(self.iter_executive_summary())
+        return buf.getvalue()[:-1]  # No trailing newline; callers print() the result
+    
+    def get_executive_summary_data(self) -> Dict[str, Any]:
+        """The executive summary's raw data, for JSON output"""
+        context = self.get_latest_context()
+        projects = context.get("projects") or {}
+        return {
+            "generated": datetime.now().isoformat(),
+            "overview": context.get("summary") or {},
+            "recent_commits": {
+                project_name: commits[:3]
+                for project_name, project_data in projects.items()
+                if (commits := (project_data.get("git_info") or {}).get("commits"))
+            },
+            "recent_decisions": self.get_all_decisions(days_back=1)[:5],
+            "progress": self.get_progress_report(),
+            "critical_todos": list(itertools.islice(self._critical_todos(projects), 10))
+        }
 
 def main():
     parser = argparse.ArgumentParser(description="Query project context")
@@ -247,7 +459,7 @@ def main():
     if args.command == "latest":
         result = query.get_latest_context()
         if args.format == "json":
-            print(json.dumps(result, indent=2))
+            print(_json_dumps(result))
         else:
             print(f"Latest context from: {result.get('timestamp', 'Unknown')}")
             print(f"Projects: {', '.join(result.get('projects', {}).keys())}")
@@ -255,7 +467,7 @@ def main():
     elif args.command == "history":
         result = query.get_context_history(days_back=args.days)
         if args.format == "json":
-            print(json.dumps(result, indent=2))
+            print(_json_dumps(result))
         else:
             print(f"Found {len(result)} context snapshots from the last {args.days} days")
             
@@ -265,7 +477,7 @@ def main():
             return
         result = query.get_project_summary(args.project)
         if args.format == "json":
-            print(json.dumps(result, indent=2))
+            print(_json_dumps(result))
         else:
             if "error" in result:
                 print(result["error"])
@@ -279,7 +491,7 @@ def main():
     elif args.command == "decisions":
         result = query.get_all_decisions(days_back=args.days, project=args.project)
         if args.format == "json":
-            print(json.dumps(result, indent=2))
+            print(_json_dumps(result))
         else:
             print(f"Found {len(result)} decisions from the last {args.days} days")
             for decision in result[:10]:
@@ -288,7 +500,7 @@ def main():
     elif args.command == "progress":
         result = query.get_progress_report(project=args.project)
         if args.format == "json":
-            print(json.dumps(result, indent=2))
+            print(_json_dumps(result))
         else:
             for project, tasks in result.items():
                 print(f"\n{project}:")
@@ -296,7 +508,11 @@ def main():
                     print(f"  - {task}: {info['status']} ({info['completion']}%)")
                     
     elif args.command == "summary":
-        print(query.generate_executive_summary())
+        if args.format == "json":
+            print(_json_dumps(query.get_executive_summary_data()))
+        else:
+            # Stream sections as they are produced, so piping into head stops early
+            sys.stdout.writelines(query.iter_executive_summary())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,10 +4,16 @@ Real-time Project Monitoring System
 Monitors code quality, security, testing, git status, and more across all projects
 """
 
+import io
 import os
+import re
+import mmap
 import json
+import queue
+import signal
 import subprocess
 import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 import threading
@@ -15,13 +21,151 @@ import asyncio
 from typing import Dict, List, Any, Optional
 import hashlib
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import pygit2
+except ImportError:  # pygit2 is optional; fall back to the git CLI
+    pygit2 = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it tool output is parsed in one go
+    ijson = None
+
+try:
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; --watch falls back to timed rescans
+    Observer = None
 
 PROJECTS_ROOT = "/Users/MAC/Documents/projects"
 ADMIN_ROOT = "/Users/MAC/Documents/projects/admin"
 MONITORING_DIR = os.path.join(ADMIN_ROOT, "monitoring")
+MONITOR_WORKERS = 32  # Projects monitored concurrently; the checks mostly wait on subprocesses
+ALERT_CATEGORIES = ("git", "quality", "security", "dependencies")
+# Report order and heading emoji for each overall_health value
+HEALTH_STATUS_EMOJI = {"critical": "🚨", "warning": "⚠️", "good": "✅", "excellent": "🌟"}
+WATCH_INTERVAL_SECONDS = 300  # Full rescan cadence in --watch mode
+WATCH_DEBOUNCE_SECONDS = 2  # Changes arriving within this window are rescanned together
+MAX_CONCURRENT_COMMANDS = 16  # Tool subprocesses allowed to run at once across all projects
+
+LINT_CONFIGS = {".eslintrc", ".eslintrc.js", ".eslintrc.json", "ruff.toml", ".flake8", "pylint.rc"}
+FORMAT_CONFIGS = {".prettierrc", ".prettier.json", "pyproject.toml", ".black"}
+TEST_DIRS = {"test", "tests", "__tests__", "spec"}
+PYTHON_MANIFESTS = {"requirements.txt", "pyproject.toml", "Pipfile"}
+SKIP_DIRS = {".git", "node_modules", "venv", ".venv", "dist", "build", "target", "__pycache__"}
+SECRET_SCAN_SUFFIXES = {".js", ".ts", ".py", ".json", ".yml", ".yaml", ".env"}
+SECRET_SCAN_MMAP_BYTES = 64 * 1024  # Files at least this large are mmapped instead of read
+# A secret-ish name followed by an assignment on the same line; one pass over raw bytes
+SECRET_ASSIGNMENT_RE = re.compile(
+    rb"(?i)(api_key|secret_key|password|token|aws_access_key|private_key|credential|auth_token)[^\n]{0,80}="
+)
+
+# Projects and their checks all run concurrently; this caps the subprocesses they
+# spawn so a full scan can't launch projects x tools processes at once
+_command_slots = threading.BoundedSemaphore(MAX_CONCURRENT_COMMANDS)
+
+@dataclass(frozen=True, slots=True)
+class ProjectContext:
+    """What the checkers need to know about a project's top level, read once per scan"""
+    path: Path
+    entries: frozenset  # Names in the project's top-level directory
+    is_git: bool
+    is_node: bool
+    is_python: bool
+    
+    @classmethod
+    def scan(cls, project_path: Path) -> "ProjectContext":
+        """Build the context from a single directory listing (empty if it can't be listed)"""
+        try:
+            entries = frozenset(os.listdir(project_path))
+        except OSError:
+            entries = frozenset()
+        return cls(
+            path=project_path,
+            entries=entries,
+            is_git=".git" in entries,
+            is_node="package.json" in entries,
+            is_python=not PYTHON_MANIFESTS.isdisjoint(entries)
+        )
+
+class _ProjectChangeHandler:
+    """watchdog handler that queues its project for a rescan when a watched file changes"""
+    
+    # Read-only events (opened, closed_no_write) are ignored: the scan itself reads files
+    EVENT_TYPES = {"created", "deleted", "modified", "moved", "closed"}
+    
+    def __init__(self, project_path: Path, changes: queue.Queue, names: Optional[set] = None):
+        self.project_path = project_path
+        self.changes = changes
+        self.names = names  # Only these file names count; None means any non-skipped name
+    
+    def dispatch(self, event):
+        if event.is_directory or event.event_type not in self.EVENT_TYPES:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            name = os.path.basename(os.fsdecode(path))
+            if not name:
+                continue
+            if (name in self.names) if self.names is not None else (name not in SKIP_DIRS):
+                self.changes.put(self.project_path)
+                return
+
+def _iter_json_prefix(data: Any, path: List[str], pairs: bool = False):
+    """Yield the values (or key/value pairs) at an ijson-style prefix path of parsed JSON"""
+    if not path:
+        if not pairs:
+            yield data
+        elif isinstance(data, dict):
+            yield from data.items()
+        return
+    
+    key, rest = path[0], path[1:]
+    if key == "item":
+        if isinstance(data, list):
+            for value in data:
+                yield from _iter_json_prefix(value, rest, pairs)
+    elif isinstance(data, dict) and key in data:
+        yield from _iter_json_prefix(data[key], rest, pairs)
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes (2-space indented if requested), using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+def _atomic_write(path: Path, payload: bytes):
+    """Replace path via a temp file in the same directory so readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _write_monitoring_files(results: Dict[str, Any], alerts_summary: Dict[str, Any], results_file: Path,
+                            latest_file: Path, alerts_file: Path, payload: Optional[bytes] = None):
+    """Write a scan's snapshot, latest copy and alerts summary, encoding results if payload isn't given"""
+    if payload is None:
+        payload = _json_dumps(results, indent=True)
+    results_file.write_bytes(payload)
+    _atomic_write(latest_file, payload)
+    alerts_file.write_bytes(_json_dumps(alerts_summary, indent=True))
+
+def _ignore_sigint():
+    """Encode-worker initializer: leave Ctrl+C to the parent, which flushes pending writes"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
 
 class RealTimeMonitor:
-    def __init__(self):
+    def __init__(self, max_workers: int = MONITOR_WORKERS):
+        self.max_workers = max_workers
         self.projects_root = Path(PROJECTS_ROOT)
         self.monitoring_dir = Path(MONITORING_DIR)
         self.monitoring_dir.mkdir(parents=True, exist_ok=True)
@@ -33,6 +177,15 @@ class RealTimeMonitor:
         self.monitoring_active = False
         self.alerts = []
         
+        # Watch-mode caches of git ref state, invalidated by .git file mtimes
+        self._git_cache = {}  # project_path -> (ref fingerprint, last commit timestamp)
+        self._lint_cache = {}  # (project_path, linter) -> (source fingerprint, lint errors)
+        self._watching = False  # Only watch mode rescans projects in-process, so only it caches lint runs
+        self._latest = None  # Results mirrored in latest.json, merged into by watch mode
+        self._project_json = {}  # project name -> (result dict, its indented JSON encoding)
+        self._encode_pool = None  # Watch mode encodes and writes full scans in this worker process
+        self._pending_write = None  # Future of the last full scan handed to the encode worker
+        
         # Monitoring configuration
         self.config = {
             "git_monitoring": {
@@ -67,19 +220,23 @@ class RealTimeMonitor:
         }
     
     def run_command(self, command: List[str], cwd: Path = None, timeout: int = 30) -> Dict[str, Any]:
-        """Run a command and return result"""
+        """Run a command and return result, with stdout/stderr as raw, unstripped bytes.
+        
+        Every caller feeds the output to json.loads/int or splits it into lines,
+        which all accept bytes, so there is no decode and strip.
+        """
         try:
-            result = subprocess.run(
-                command, 
-                capture_output=True, 
-                text=True, 
-                timeout=timeout,
-                cwd=cwd or self.projects_root
-            )
+            with _command_slots:
+                result = subprocess.run(
+                    command, 
+                    capture_output=True, 
+                    timeout=timeout,
+                    cwd=cwd or self.projects_root
+                )
             return {
                 "success": result.returncode == 0,
-                "stdout": result.stdout.strip(),
-                "stderr": result.stderr.strip(),
+                "stdout": result.stdout,
+                "stderr": result.stderr,
                 "returncode": result.returncode
             }
         except subprocess.TimeoutExpired:
@@ -87,8 +244,176 @@ class RealTimeMonitor:
         except Exception as e:
             return {"success": False, "error": str(e), "returncode": -1}
     
-    def check_git_status(self, project_path: Path) -> Dict[str, Any]:
+    def stream_json_output(self, command: List[str], prefix: str, status: Dict[str, Any],
+                           cwd: Path = None, timeout: int = 30, pairs: bool = False):
+        """Run a command, yielding the JSON values at `prefix` as its stdout is decoded.
+        
+        `status` is filled with success/returncode once the output is exhausted;
+        malformed output counts as a failure. With ijson installed only one item
+        is held in memory at a time.
+        """
+        with _command_slots:
+            try:
+                proc = subprocess.Popen(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    cwd=cwd or self.projects_root
+                )
+            except Exception as e:
+                status.update({"success": False, "error": str(e), "returncode": -1})
+                return
+            
+            timer = threading.Timer(timeout, proc.kill)
+            timer.start()
+            parse_error = None
+            try:
+                if ijson is not None:
+                    parse = ijson.kvitems if pairs else ijson.items
+                    yield from parse(proc.stdout, prefix, use_float=True)
+                else:
+                    yield from _iter_json_prefix(json.loads(proc.stdout.read()), prefix.split("."), pairs)
+            except Exception as e:
+                parse_error = str(e)
+            finally:
+                # Drain the rest so the tool can exit and report its status
+                while proc.stdout.read(65536):
+                    pass
+                proc.stdout.close()
+                proc.wait()
+                timed_out = timer.finished.is_set()
+                timer.cancel()
+                if timed_out:
+                    status.update({"success": False, "error": "Command timed out", "returncode": -1})
+                elif parse_error is not None:
+                    status.update({"success": False, "error": parse_error, "returncode": proc.returncode})
+                else:
+                    status.update({"success": proc.returncode == 0, "returncode": proc.returncode})
+    
+    def _git_fingerprint(self, project_path: Path) -> Optional[tuple]:
+        """Fingerprint the files git updates when HEAD or the checked-out branch moves"""
+        git_dir = project_path / ".git"
+        try:
+            with open(git_dir / "HEAD", 'rb') as f:
+                head = f.read().strip()
+        except OSError:
+            return None  # .git is a file (worktree/submodule); don't cache
+        
+        paths = [git_dir / "HEAD", git_dir / "packed-refs"]
+        if head.startswith(b"ref: "):
+            branch_ref = head[5:].decode("utf-8", "replace")
+            paths.append(git_dir / branch_ref)
+        
+        mtimes = []
+        for path in paths:
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)  # Loose ref not present (packed or never created)
+        return head, tuple(mtimes)
+    
+    def _get_last_commit_timestamp(self, project_path: Path) -> Optional[int]:
+        """Commit time of HEAD via the CLI, cached until the ref files change"""
+        fingerprint = self._git_fingerprint(project_path)
+        cached = self._git_cache.get(project_path)
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        timestamp = None
+        result = self.run_command(["git", "log", "-1", "--format=%ct"], project_path)
+        if result["success"] and result["stdout"].strip():
+            timestamp = int(result["stdout"])
+        if fingerprint is not None:
+            self._git_cache[project_path] = (fingerprint, timestamp)
+        return timestamp
+    
+    def _read_git_status_pygit2(self, project_path: Path) -> Optional[tuple]:
+        """(refs status, uncommitted changes, untracked files) read with pygit2, or None to use the CLI"""
+        refs_status = {
+            "current_branch": None,
+            "unpushed_commits": 0,
+            "behind_remote": 0,
+            "last_commit_timestamp": None
+        }
+        try:
+            repo = pygit2.Repository(str(project_path))
+            
+            if repo.head_is_unborn:
+                refs_status["current_branch"] = repo.references["HEAD"].target.removeprefix("refs/heads/")
+            else:
+                head = repo.head
+                # Like `git branch --show-current`, a detached HEAD has an empty branch name
+                refs_status["current_branch"] = "" if repo.head_is_detached else head.shorthand
+                refs_status["last_commit_timestamp"] = head.peel(pygit2.Commit).commit_time
+                
+                branch = None if repo.head_is_detached else repo.branches.local.get(head.shorthand)
+                upstream = branch.upstream if branch is not None else None
+                if upstream is not None:
+                    refs_status["unpushed_commits"], refs_status["behind_remote"] = repo.ahead_behind(
+                        head.target, upstream.target
+                    )
+            
+            # "normal" collapses untracked directories like `git status --porcelain`
+            status = repo.status(untracked_files="normal")
+        except (pygit2.GitError, KeyError, ValueError, TypeError):
+            return None
+        
+        untracked_files = sorted(path for path, flags in status.items() if flags & pygit2.GIT_STATUS_WT_NEW)
+        return refs_status, bool(status), untracked_files
+    
+    def _read_git_status_cli(self, project_path: Path) -> tuple:
+        """(refs status, uncommitted changes, untracked files) from one `git status --porcelain=v2 --branch`"""
+        refs_status = {
+            "current_branch": None,
+            "unpushed_commits": 0,
+            "behind_remote": 0,
+            "last_commit_timestamp": None
+        }
+        uncommitted_changes = False
+        untracked_files = []
+        
+        # The branch headers carry the branch name and ahead/behind counts, so one
+        # call replaces `branch --show-current`, `rev-list` and `status --porcelain`
+        result = self.run_command(["git", "status", "--porcelain=v2", "--branch", "-z"], project_path)
+        if result["success"]:
+            records = iter(result["stdout"].split(b"\0"))
+            for record in records:
+                if record.startswith(b"# branch.head "):
+                    head = os.fsdecode(record[14:])
+                    # Like `git branch --show-current`, a detached HEAD has an empty branch name
+                    refs_status["current_branch"] = "" if head == "(detached)" else head
+                elif record.startswith(b"# branch.ab "):
+                    ahead, behind = record[12:].split()
+                    refs_status["unpushed_commits"] = int(ahead)
+                    refs_status["behind_remote"] = -int(behind)
+                elif record.startswith(b"#") or not record:
+                    continue
+                else:
+                    uncommitted_changes = True
+                    if record.startswith(b"? "):
+                        untracked_files.append(os.fsdecode(record[2:]))
+                    elif record.startswith(b"2 "):
+                        next(records, None)  # Renames/copies are followed by their original path
+        
+        refs_status["last_commit_timestamp"] = self._get_last_commit_timestamp(project_path)
+        return refs_status, uncommitted_changes, untracked_files
+    
+    def _walk(self, root: Path):
+        """Yield every DirEntry under root, never descending into SKIP_DIRS"""
+        pending = [str(root)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False) and entry.name not in SKIP_DIRS:
+                            pending.append(entry.path)
+                        yield entry
+            except OSError:
+                continue
+    
+    def check_git_status(self, ctx: ProjectContext) -> Dict[str, Any]:
         """Check git status for a project"""
+        project_path = ctx.path
         git_status = {
             "is_git_repo": False,
             "current_branch": None,
@@ -100,35 +425,22 @@ class RealTimeMonitor:
             "alerts": []
         }
         
-        if not (project_path / ".git").exists():
+        if not ctx.is_git:
             return git_status
         
         git_status["is_git_repo"] = True
         
-        # Get current branch
-        result = self.run_command(["git", "branch", "--show-current"], project_path)
-        if result["success"]:
-            git_status["current_branch"] = result["stdout"]
-        
-        # Check for uncommitted changes
-        result = self.run_command(["git", "status", "--porcelain"], project_path)
-        if result["success"] and result["stdout"]:
-            git_status["uncommitted_changes"] = True
-            lines = result["stdout"].split('\n')
-            for line in lines:
-                if line.startswith('??'):
-                    git_status["untracked_files"].append(line[3:])
-        
-        # Check for unpushed commits
-        result = self.run_command(["git", "log", "--oneline", "@{upstream}..HEAD"], project_path)
-        if result["success"]:
-            git_status["unpushed_commits"] = len([l for l in result["stdout"].split('\n') if l.strip()])
+        # Read everything in-process through libgit2 when available: no git subprocesses
+        repo_status = self._read_git_status_pygit2(project_path) if pygit2 is not None else None
+        if repo_status is None:
+            repo_status = self._read_git_status_cli(project_path)
+        refs_status, git_status["uncommitted_changes"], git_status["untracked_files"] = repo_status
         
-        # Get last commit age
-        result = self.run_command(["git", "log", "-1", "--format=%ct"], project_path)
-        if result["success"] and result["stdout"]:
-            last_commit_timestamp = int(result["stdout"])
-            last_commit_time = datetime.fromtimestamp(last_commit_timestamp)
+        git_status["current_branch"] = refs_status["current_branch"]
+        git_status["unpushed_commits"] = refs_status["unpushed_commits"]
+        git_status["behind_remote"] = refs_status["behind_remote"]
+        if refs_status["last_commit_timestamp"] is not None:
+            last_commit_time = datetime.fromtimestamp(refs_status["last_commit_timestamp"])
             git_status["last_commit_age_hours"] = (datetime.now() - last_commit_time).total_seconds() / 3600
         
         # Generate alerts
@@ -141,8 +453,61 @@ class RealTimeMonitor:
         
         return git_status
     
-    def check_code_quality(self, project_path: Path) -> Dict[str, Any]:
+    def _source_fingerprint(self, project_path: Path) -> tuple:
+        """Cheap change detector for a project's sources: (file list hash, newest mtime, missing files)"""
+        # Tracked plus untracked-but-not-ignored files, i.e. what a linter would see
+        result = self.run_command(["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"], project_path)
+        if result["success"]:
+            names = result["stdout"]
+            root = os.fsencode(project_path)
+            paths = [os.path.join(root, name) for name in names.split(b"\0") if name]
+        else:
+            paths = [entry.path for entry in self._walk(project_path) if entry.is_file(follow_symlinks=False)]
+            names = os.fsencode("\0".join(paths))
+        
+        newest = 0
+        missing = []
+        for path in paths:
+            try:
+                newest = max(newest, os.stat(path).st_mtime_ns)
+            except OSError:
+                # Deleted but not staged: ls-files still lists it, so record it
+                # here or the deletion wouldn't change the fingerprint
+                missing.append(path)
+        return hash(names), newest, tuple(missing)
+    
+    def _get_lint_errors(self, project_path: Path, linter: str) -> Optional[int]:
+        """Lint error count, reusing the last run while no source file has changed"""
+        if not self._watching:
+            # A one-shot scan lints each project once; fingerprinting could never pay off
+            return self._run_linter(project_path, linter)
+        
+        fingerprint = self._source_fingerprint(project_path)
+        cached = self._lint_cache.get((project_path, linter))
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        lint_errors = self._run_linter(project_path, linter)
+        if lint_errors is not None:
+            self._lint_cache[(project_path, linter)] = (fingerprint, lint_errors)
+        return lint_errors
+    
+    def _run_linter(self, project_path: Path, linter: str) -> Optional[int]:
+        """Run eslint or ruff and count the reported problems; None if the run failed"""
+        # Only counts are needed, so the reports are streamed rather than loaded whole
+        status = {}
+        if linter == "eslint":
+            files = self.stream_json_output(["npx", "eslint", ".", "--format", "json"], "item", status, project_path)
+            lint_errors = sum(len(file.get("messages", [])) for file in files if isinstance(file, dict))
+        else:
+            problems = self.stream_json_output(["ruff", "check", ".", "--output-format", "json"], "item", status, project_path)
+            lint_errors = sum(1 for _ in problems)
+        return lint_errors if status["success"] else None
+    
+    def check_code_quality(self, ctx: ProjectContext) -> Dict[str, Any]:
         """Check code quality metrics"""
+        project_path = ctx.path
+        entries = ctx.entries
         quality_status = {
             "has_linting": False,
             "has_formatting": False,
@@ -154,46 +519,32 @@ class RealTimeMonitor:
         }
         
         # Check for linting config
-        lint_configs = [".eslintrc", ".eslintrc.js", ".eslintrc.json", "ruff.toml", ".flake8", "pylint.rc"]
-        for config in lint_configs:
-            if (project_path / config).exists():
-                quality_status["has_linting"] = True
-                break
+        quality_status["has_linting"] = not LINT_CONFIGS.isdisjoint(entries)
         
         # Check for formatting config
-        format_configs = [".prettierrc", ".prettier.json", "pyproject.toml", ".black"]
-        for config in format_configs:
-            if (project_path / config).exists():
-                quality_status["has_formatting"] = True
-                break
+        quality_status["has_formatting"] = not FORMAT_CONFIGS.isdisjoint(entries)
         
         # Check for tests
-        test_dirs = ["test", "tests", "__tests__", "spec"]
-        test_files = list(project_path.glob("**/*test*")) + list(project_path.glob("**/*spec*"))
-        if any((project_path / test_dir).exists() for test_dir in test_dirs) or test_files:
+        if not TEST_DIRS.isdisjoint(entries) or any(
+            "test" in entry.name or "spec" in entry.name for entry in self._walk(project_path)
+        ):
+            # Only "any?" matters, so the walk stops at the first test-like name
             quality_status["has_tests"] = True
         
         # Run linting if available
         if quality_status["has_linting"]:
+            linter = None
             # Try ESLint for JS/TS projects
-            if (project_path / "package.json").exists():
-                result = self.run_command(["npx", "eslint", ".", "--format", "json"], project_path)
-                if result["success"]:
-                    try:
-                        lint_results = json.loads(result["stdout"])
-                        quality_status["lint_errors"] = sum(len(file.get("messages", [])) for file in lint_results)
-                    except:
-                        pass
-            
+            if ctx.is_node:
+                linter = "eslint"
             # Try ruff for Python projects
-            elif (project_path / "ruff.toml").exists() or any(f.suffix == ".py" for f in project_path.glob("*.py")):
-                result = self.run_command(["ruff", "check", ".", "--output-format", "json"], project_path)
-                if result["success"]:
-                    try:
-                        lint_results = json.loads(result["stdout"])
-                        quality_status["lint_errors"] = len(lint_results)
-                    except:
-                        pass
+            elif "ruff.toml" in entries or any(name.endswith(".py") for name in entries):
+                linter = "ruff"
+            
+            if linter is not None:
+                lint_errors = self._get_lint_errors(project_path, linter)
+                if lint_errors is not None:
+                    quality_status["lint_errors"] = lint_errors
         
         # Generate alerts
         if not quality_status["has_linting"]:
@@ -210,8 +561,17 @@ class RealTimeMonitor:
         
         return quality_status
     
-    def check_security(self, project_path: Path) -> Dict[str, Any]:
+    def _has_secret_assignment(self, file_path: str) -> bool:
+        """Search a file's raw bytes for a secret assignment, stopping at the first hit"""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < SECRET_SCAN_MMAP_BYTES:
+                return SECRET_ASSIGNMENT_RE.search(f.read()) is not None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return SECRET_ASSIGNMENT_RE.search(content) is not None
+    
+    def check_security(self, ctx: ProjectContext) -> Dict[str, Any]:
         """Check security status"""
+        project_path = ctx.path
         security_status = {
             "has_security_scan": False,
             "dependency_vulnerabilities": 0,
@@ -222,19 +582,20 @@ class RealTimeMonitor:
         }
         
         # Check for dependency vulnerabilities in Node.js projects
-        if (project_path / "package.json").exists():
-            result = self.run_command(["npm", "audit", "--json"], project_path)
-            if result["success"]:
-                try:
-                    audit_results = json.loads(result["stdout"])
-                    if "vulnerabilities" in audit_results:
-                        security_status["dependency_vulnerabilities"] = audit_results["vulnerabilities"].get("total", 0)
-                        security_status["has_security_scan"] = True
-                except:
-                    pass
+        if ctx.is_node:
+            # Audits of large trees run to megabytes; stream past everything but the total
+            status = {}
+            vulnerabilities = 0
+            for key, value in self.stream_json_output(["npm", "audit", "--json"], "vulnerabilities", status,
+                                                      project_path, pairs=True):
+                if key == "total":
+                    vulnerabilities = value
+            if status["success"]:
+                security_status["dependency_vulnerabilities"] = vulnerabilities
+                security_status["has_security_scan"] = True
         
         # Check for Python vulnerabilities
-        elif any(f.name in ["requirements.txt", "pyproject.toml", "Pipfile"] for f in project_path.glob("*")):
+        elif ctx.is_python:
             # Check if safety is available
             result = self.run_command(["safety", "check", "--json"], project_path)
             if result["success"]:
@@ -246,21 +607,12 @@ class RealTimeMonitor:
                     pass
         
         # Simple secret detection (basic patterns)
-        secret_patterns = [
-            "api_key", "secret_key", "password", "token", "aws_access_key",
-            "private_key", "credential", "auth_token"
-        ]
-        
-        for file_path in project_path.glob("**/*"):
-            if file_path.is_file() and file_path.suffix in [".js", ".ts", ".py", ".json", ".yml", ".yaml", ".env"]:
+        for entry in self._walk(project_path):
+            if os.path.splitext(entry.name)[1] in SECRET_SCAN_SUFFIXES and entry.is_file():
                 try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read().lower()
-                        for pattern in secret_patterns:
-                            if pattern in content and "=" in content:
-                                security_status["secret_leaks"] += 1
-                                break
-                except:
+                    if self._has_secret_assignment(entry.path):
+                        security_status["secret_leaks"] += 1
+                except (OSError, ValueError):
                     pass
         
         # Generate alerts
@@ -275,8 +627,9 @@ class RealTimeMonitor:
         
         return security_status
     
-    def check_dependencies(self, project_path: Path) -> Dict[str, Any]:
+    def check_dependencies(self, ctx: ProjectContext) -> Dict[str, Any]:
         """Check dependency status"""
+        project_path = ctx.path
         dep_status = {
             "has_dependencies": False,
             "outdated_packages": 0,
@@ -287,7 +640,7 @@ class RealTimeMonitor:
         }
         
         # Check Node.js dependencies
-        if (project_path / "package.json").exists():
+        if ctx.is_node:
             dep_status["has_dependencies"] = True
             dep_status["package_manager"] = "npm"
             
@@ -301,7 +654,7 @@ class RealTimeMonitor:
                     pass
         
         # Check Python dependencies
-        elif (project_path / "requirements.txt").exists() or (project_path / "pyproject.toml").exists():
+        elif "requirements.txt" in ctx.entries or "pyproject.toml" in ctx.entries:
             dep_status["has_dependencies"] = True
             dep_status["package_manager"] = "pip"
             
@@ -320,27 +673,46 @@ class RealTimeMonitor:
         
         return dep_status
     
+    async def run_checks(self, ctx: ProjectContext):
+        """Run the git, quality, security and dependency checks for a project concurrently"""
+        # Each check blocks on its own subprocesses, so overlapping them makes the
+        # project's latency that of its slowest check rather than the sum of all four
+        return await asyncio.gather(
+            asyncio.to_thread(self.check_git_status, ctx),
+            asyncio.to_thread(self.check_code_quality, ctx),
+            asyncio.to_thread(self.check_security, ctx),
+            asyncio.to_thread(self.check_dependencies, ctx)
+        )
+    
     def monitor_project(self, project_path: Path) -> Dict[str, Any]:
         """Monitor a single project"""
         project_name = project_path.name
         
+        timestamp = datetime.now().isoformat()
+        # One directory listing answers every top-level probe the checks make
+        ctx = ProjectContext.scan(project_path)
+        git, quality, security, dependencies = asyncio.run(self.run_checks(ctx))
+        
         monitoring_result = {
             "project": project_name,
             "path": str(project_path),
-            "timestamp": datetime.now().isoformat(),
-            "git": self.check_git_status(project_path),
-            "quality": self.check_code_quality(project_path),
-            "security": self.check_security(project_path),
-            "dependencies": self.check_dependencies(project_path),
+            "timestamp": timestamp,
+            "git": git,
+            "quality": quality,
+            "security": security,
+            "dependencies": dependencies,
             "overall_health": "good",
             "total_alerts": 0
         }
         
-        # Calculate overall health
-        total_alerts = 0
-        for category in ["git", "quality", "security", "dependencies"]:
-            total_alerts += len(monitoring_result[category].get("alerts", []))
+        # Calculate overall health; per-category counts are kept for the report and alerts summary
+        alerts_by_category = {
+            category: len(monitoring_result[category].get("alerts", []))
+            for category in ALERT_CATEGORIES
+        }
+        total_alerts = sum(alerts_by_category.values())
         
+        monitoring_result["alerts_by_category"] = alerts_by_category
         monitoring_result["total_alerts"] = total_alerts
         
         if total_alerts == 0:
@@ -368,38 +740,228 @@ class RealTimeMonitor:
             }
         }
         
-        for project_dir in self.projects_root.iterdir():
-            if project_dir.is_dir() and project_dir.name != "admin":
-                print(f"🔍 Monitoring {project_dir.name}...")
-                result = self.monitor_project(project_dir)
+        project_dirs = self.list_project_dirs()
+        for project_dir in project_dirs:
+            print(f"🔍 Monitoring {project_dir.name}...")
+        
+        # The checks are dominated by git/npm/linter subprocess waits, so threads
+        # overlap them well; results are aggregated in directory order after each finishes
+        max_workers = max(1, min(len(project_dirs), self.max_workers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for project_dir, result in zip(project_dirs, executor.map(self.monitor_project, project_dirs)):
                 monitoring_results["projects"][project_dir.name] = result
-                
-                # Update summary
-                monitoring_results["summary"]["total_projects"] += 1
-                monitoring_results["summary"]["total_alerts"] += result["total_alerts"]
-                
-                if result["overall_health"] == "excellent" or result["overall_health"] == "good":
-                    monitoring_results["summary"]["healthy_projects"] += 1
-                elif result["overall_health"] == "warning":
-                    monitoring_results["summary"]["warning_projects"] += 1
-                else:
-                    monitoring_results["summary"]["critical_projects"] += 1
         
+        monitoring_results["summary"] = self.summarize_projects(monitoring_results["projects"])
         return monitoring_results
     
+    def list_project_dirs(self) -> List[Path]:
+        """Project directories to monitor (everything under the root except admin)"""
+        return [
+            project_dir for project_dir in self.projects_root.iterdir()
+            if project_dir.is_dir() and project_dir.name != "admin"
+        ]
+    
+    def summarize_projects(self, projects: Dict[str, Any]) -> Dict[str, int]:
+        """Fleet summary computed from per-project monitoring results"""
+        summary = {
+            "total_projects": 0,
+            "healthy_projects": 0,
+            "warning_projects": 0,
+            "critical_projects": 0,
+            "total_alerts": 0
+        }
+        
+        for result in projects.values():
+            summary["total_projects"] += 1
+            summary["total_alerts"] += result["total_alerts"]
+            
+            if result["overall_health"] == "excellent" or result["overall_health"] == "good":
+                summary["healthy_projects"] += 1
+            elif result["overall_health"] == "warning":
+                summary["warning_projects"] += 1
+            else:
+                summary["critical_projects"] += 1
+        
+        return summary
+    
+    def _print_watch_status(self, results: Dict[str, Any]):
+        """One-line fleet status printed after each --watch scan"""
+        print(f"Status: {results['summary']['healthy_projects']}✅ "
+              f"{results['summary']['warning_projects']}⚠️ "
+              f"{results['summary']['critical_projects']}🚨")
+    
+    def _full_watch_scan(self) -> Dict[str, Any]:
+        print(f"\n🔍 Monitoring scan at {datetime.now().strftime('%H:%M:%S')}")
+        results = self.monitor_all_projects()
+        self.save_monitoring_results(results)
+        self._print_watch_status(results)
+        return results
+    
+    def _drop_self_induced_changes(self, changes: queue.Queue, scanned: Optional[set] = None):
+        """Discard queued changes for projects that were just scanned (all if scanned is None)
+        
+        Scanning can itself touch .git/index (git status refreshes stat data),
+        which would otherwise trigger another rescan of the same project.
+        """
+        keep = []
+        while True:
+            try:
+                project_dir = changes.get_nowait()
+            except queue.Empty:
+                break
+            if scanned is not None and project_dir not in scanned:
+                keep.append(project_dir)
+        for project_dir in keep:
+            changes.put(project_dir)
+    
+    def _wait_for_pending_write(self):
+        """Block until the encode worker has written the last full scan"""
+        if self._pending_write is None:
+            return
+        try:
+            self._pending_write.result()
+        except Exception as e:
+            print(f"⚠️ Failed to save monitoring results: {e}")
+        self._pending_write = None
+    
+    def watch_projects(self, interval: int = WATCH_INTERVAL_SECONDS):
+        """Continuous monitoring: rescan a project as soon as it changes, plus a full scan every interval"""
+        # Encoding a large fleet's results is CPU-bound; one worker process does it
+        # while the next scan waits on its subprocesses. A single worker keeps
+        # memory overhead down and writes in order.
+        try:
+            self._encode_pool = ProcessPoolExecutor(max_workers=1, initializer=_ignore_sigint)
+        except (OSError, NotImplementedError):
+            self._encode_pool = None  # No multiprocessing support; write inline
+        
+        self._watching = True
+        try:
+            if Observer is None:
+                # No filesystem events available; rescan everything on a timer
+                while True:
+                    self._full_watch_scan()
+                    time.sleep(interval)
+            self._watch_filesystem_events(interval)
+        finally:
+            self._watching = False
+            self._wait_for_pending_write()
+            if self._encode_pool is not None:
+                self._encode_pool.shutdown()
+                self._encode_pool = None
+    
+    def _watch_filesystem_events(self, interval: int):
+        # Watch each project's top-level files and its .git HEAD/index (commits,
+        # staging, checkouts). Nested edits and remote changes aren't watched,
+        # so the timed full scan stays as a backstop.
+        changes = queue.Queue()
+        observer = Observer()
+        for project_dir in self.list_project_dirs():
+            observer.schedule(_ProjectChangeHandler(project_dir, changes), str(project_dir), recursive=False)
+            if (project_dir / ".git").is_dir():
+                observer.schedule(
+                    _ProjectChangeHandler(project_dir, changes, names={"HEAD", "index"}),
+                    str(project_dir / ".git"), recursive=False
+                )
+        observer.start()
+        
+        try:
+            self._full_watch_scan()
+            self._drop_self_induced_changes(changes)
+            next_full_scan = time.monotonic() + interval
+            while True:
+                try:
+                    pending = {changes.get(timeout=max(0, next_full_scan - time.monotonic()))}
+                except queue.Empty:
+                    self._full_watch_scan()
+                    self._drop_self_induced_changes(changes)
+                    next_full_scan = time.monotonic() + interval
+                    continue
+                
+                # Debounce: gather whatever else changes within the window
+                deadline = time.monotonic() + WATCH_DEBOUNCE_SECONDS
+                while (remaining := deadline - time.monotonic()) > 0:
+                    try:
+                        pending.add(changes.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+                
+                rescanned = {}
+                removed = []
+                for project_dir in sorted(pending):
+                    if project_dir.is_dir():
+                        print(f"\n🔍 Change in {project_dir.name}, rescanning")
+                        rescanned[project_dir.name] = self.monitor_project(project_dir)
+                    else:
+                        removed.append(project_dir.name)
+                self._drop_self_induced_changes(changes, pending)
+                
+                # Only latest.json is refreshed between full scans; history
+                # snapshots are written by the full scans themselves. The last
+                # full scan's write must land first or it would clobber this one.
+                self._wait_for_pending_write()
+                self.update_latest(rescanned, removed)
+                self._print_watch_status(self._latest)
+        finally:
+            observer.stop()
+            observer.join()
+    
+    def _encode_results(self, results: Dict[str, Any]) -> bytes:
+        """Indented JSON for results, reusing the encoding of project results that haven't changed"""
+        parts = [b"{"]
+        for i, (key, value) in enumerate(results.items()):
+            parts.append(b",\n  " if i else b"\n  ")
+            parts.append(_json_dumps(key) + b": ")
+            if key != "projects" or not value:
+                parts.append(_json_dumps(value, indent=True).replace(b"\n", b"\n  "))
+                continue
+            
+            parts.append(b"{")
+            for j, (name, result) in enumerate(value.items()):
+                cached = self._project_json.get(name)
+                if cached is None or cached[0] is not result:
+                    # JSON strings never contain raw newlines, so re-indenting is a plain replace
+                    cached = (result, _json_dumps(result, indent=True).replace(b"\n", b"\n    "))
+                    self._project_json[name] = cached
+                parts.append(b",\n    " if j else b"\n    ")
+                parts.append(_json_dumps(name) + b": " + cached[1])
+            parts.append(b"\n  }")
+        parts.append(b"\n}" if results else b"}")
+        return b"".join(parts)
+    
+    def _write_latest(self, payload: bytes) -> Path:
+        """Atomically replace latest.json so readers never see a partial file"""
+        latest_file = self.monitoring_dir / "latest.json"
+        _atomic_write(latest_file, payload)
+        return latest_file
+    
+    def update_latest(self, project_results: Dict[str, Dict[str, Any]], removed: List[str] = ()) -> Path:
+        """Merge rescanned projects into latest.json without rewriting the history snapshots"""
+        if self._latest is None:
+            self._latest = {"timestamp": None, "projects": {}, "summary": {}}
+        self._latest["timestamp"] = datetime.now().isoformat()
+        self._latest["projects"].update(project_results)
+        for name in removed:
+            self._latest["projects"].pop(name, None)
+            self._project_json.pop(name, None)
+        self._latest["summary"] = self.summarize_projects(self._latest["projects"])
+        return self._write_latest(self._encode_results(self._latest))
+    
     def save_monitoring_results(self, results: Dict[str, Any]):
         """Save monitoring results"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._latest = results
         
-        # Save full results
-        results_file = self.monitoring_dir / f"monitoring_{timestamp}.json"
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        # A full scan replaces every project's results, so rebuild the encoding
+        # cache from the current project set; removed or renamed projects drop out
+        self._project_json = {
+            name: cached for name, cached in self._project_json.items()
+            if cached[0] is results["projects"].get(name)
+        }
         
-        # Save latest for quick access
+        # Full results, latest copy for quick access, and alerts summary
+        results_file = self.monitoring_dir / f"monitoring_{timestamp}.json"
         latest_file = self.monitoring_dir / "latest.json"
-        with open(latest_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        alerts_file = self.monitoring_dir / "alerts" / f"alerts_{timestamp}.json"
         
         # Save alerts summary
         alerts_summary = {
@@ -413,136 +975,129 @@ class RealTimeMonitor:
             if project_data["overall_health"] == "critical":
                 alerts_summary["critical_alerts"].append({
                     "project": project_name,
-                    "alerts": sum(len(project_data[cat].get("alerts", [])) 
-                                for cat in ["git", "quality", "security", "dependencies"])
+                    "alerts": project_data["total_alerts"]
                 })
             elif project_data["overall_health"] == "warning":
                 alerts_summary["warning_alerts"].append({
                     "project": project_name,
-                    "alerts": sum(len(project_data[cat].get("alerts", [])) 
-                                for cat in ["git", "quality", "security", "dependencies"])
+                    "alerts": project_data["total_alerts"]
                 })
         
-        alerts_file = self.monitoring_dir / "alerts" / f"alerts_{timestamp}.json"
-        with open(alerts_file, 'w') as f:
-            json.dump(alerts_summary, f, indent=2)
+        if self._encode_pool is not None:
+            # Watch mode: encode and write in the worker while the next scan starts
+            self._wait_for_pending_write()
+            self._pending_write = self._encode_pool.submit(
+                _write_monitoring_files, results, alerts_summary, results_file, latest_file, alerts_file
+            )
+        else:
+            # Encode once; the full results and the latest copy are identical
+            _write_monitoring_files(results, alerts_summary, results_file, latest_file, alerts_file,
+                                    payload=self._encode_results(results))
         
         return results_file, latest_file, alerts_file
     
     def generate_monitoring_report(self, results: Dict[str, Any]) -> str:
         """Generate human-readable monitoring report"""
-        report_lines = [
-            "=" * 80,
-            "REAL-TIME PROJECT MONITORING REPORT",
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "=" * 80,
-            "",
-            "## EXECUTIVE SUMMARY",
-            f"Total Projects Monitored: {results['summary']['total_projects']}",
-            f"Healthy Projects: {results['summary']['healthy_projects']} ✅",
-            f"Warning Projects: {results['summary']['warning_projects']} ⚠️",
-            f"Critical Projects: {results['summary']['critical_projects']} 🚨",
-            f"Total Alerts: {results['summary']['total_alerts']}",
-            "",
-            "## PROJECT HEALTH STATUS"
-        ]
+        summary = results["summary"]
+        buf = io.StringIO()
+        w = buf.write
+        
+        w("=" * 80 + "\n")
+        w("REAL-TIME PROJECT MONITORING REPORT\n")
+        w(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w("=" * 80 + "\n")
+        w("\n")
+        w("## EXECUTIVE SUMMARY\n")
+        w(f"Total Projects Monitored: {summary['total_projects']}\n")
+        w(f"Healthy Projects: {summary['healthy_projects']} ✅\n")
+        w(f"Warning Projects: {summary['warning_projects']} ⚠️\n")
+        w(f"Critical Projects: {summary['critical_projects']} 🚨\n")
+        w(f"Total Alerts: {summary['total_alerts']}\n")
+        w("\n")
+        w("## PROJECT HEALTH STATUS\n")
+        
+        # Bucket projects by health status in one pass
+        by_status = {status: [] for status in HEALTH_STATUS_EMOJI}
+        for project_name, project_data in results["projects"].items():
+            by_status.setdefault(project_data["overall_health"], []).append((project_name, project_data))
         
-        # Sort projects by health status
-        for status in ["critical", "warning", "good", "excellent"]:
-            projects_with_status = [
-                (name, data) for name, data in results["projects"].items()
-                if data["overall_health"] == status
-            ]
+        for status, status_emoji in HEALTH_STATUS_EMOJI.items():
+            projects_with_status = by_status[status]
+            if not projects_with_status:
+                continue
             
-            if projects_with_status:
-                status_emoji = {"critical": "🚨", "warning": "⚠️", "good": "✅", "excellent": "🌟"}
-                report_lines.append(f"\n### {status.upper()} PROJECTS {status_emoji.get(status, '')}")
+            w(f"\n### {status.upper()} PROJECTS {status_emoji}\n")
+            
+            for project_name, project_data in projects_with_status:
+                w(f"\n📂 **{project_name}**\n")
+                
+                # Git status
+                git_info = project_data["git"]
+                if git_info["is_git_repo"]:
+                    git_status = "✅" if not git_info["alerts"] else "❌"
+                    w(f"   Git: {git_status} {git_info['current_branch']}\n")
+                    if git_info["uncommitted_changes"]:
+                        w("     - Uncommitted changes detected\n")
+                    if git_info["unpushed_commits"] > 0:
+                        w(f"     - {git_info['unpushed_commits']} unpushed commits\n")
+                
+                # Quality status
+                quality_info = project_data["quality"]
+                quality_status = "✅" if not quality_info["alerts"] else "❌"
+                w(f"   Quality: {quality_status}\n")
+                if quality_info["lint_errors"] > 0:
+                    w(f"     - {quality_info['lint_errors']} linting errors\n")
+                
+                # Security status
+                security_info = project_data["security"]
+                security_status = "✅" if not security_info["alerts"] else "❌"
+                w(f"   Security: {security_status}\n")
+                if security_info["dependency_vulnerabilities"] > 0:
+                    w(f"     - {security_info['dependency_vulnerabilities']} vulnerabilities\n")
                 
-                for project_name, project_data in projects_with_status:
-                    report_lines.append(f"\n📂 **{project_name}**")
-                    
-                    # Git status
-                    git_info = project_data["git"]
-                    if git_info["is_git_repo"]:
-                        git_status = "✅" if not git_info["alerts"] else "❌"
-                        report_lines.append(f"   Git: {git_status} {git_info['current_branch']}")
-                        if git_info["uncommitted_changes"]:
-                            report_lines.append("     - Uncommitted changes detected")
-                        if git_info["unpushed_commits"] > 0:
-                            report_lines.append(f"     - {git_info['unpushed_commits']} unpushed commits")
-                    
-                    # Quality status
-                    quality_info = project_data["quality"]
-                    quality_status = "✅" if not quality_info["alerts"] else "❌"
-                    report_lines.append(f"   Quality: {quality_status}")
-                    if quality_info["lint_errors"] > 0:
-                        report_lines.append(f"     - {quality_info['lint_errors']} linting errors")
-                    
-                    # Security status
-                    security_info = project_data["security"]
-                    security_status = "✅" if not security_info["alerts"] else "❌"
-                    report_lines.append(f"   Security: {security_status}")
-                    if security_info["dependency_vulnerabilities"] > 0:
-                        report_lines.append(f"     - {security_info['dependency_vulnerabilities']} vulnerabilities")
-                    
-                    # Dependencies status
-                    deps_info = project_data["dependencies"]
-                    deps_status = "✅" if not deps_info["alerts"] else "❌"
-                    report_lines.append(f"   Dependencies: {deps_status}")
-                    if deps_info["outdated_packages"] > 0:
-                        report_lines.append(f"     - {deps_info['outdated_packages']} outdated packages")
+                # Dependencies status
+                deps_info = project_data["dependencies"]
+                deps_status = "✅" if not deps_info["alerts"] else "❌"
+                w(f"   Dependencies: {deps_status}\n")
+                if deps_info["outdated_packages"] > 0:
+                    w(f"     - {deps_info['outdated_packages']} outdated packages\n")
         
         # Add action items
-        report_lines.extend([
-            "",
-            "## RECOMMENDED ACTIONS",
-            "",
-            "### IMMEDIATE (Critical Issues)",
-        ])
-        
-        critical_actions = []
-        for project_name, project_data in results["projects"].items():
-            if project_data["overall_health"] == "critical":
-                for category in ["git", "quality", "security", "dependencies"]:
-                    for alert in project_data[category].get("alerts", []):
-                        critical_actions.append(f"🚨 {project_name}: {alert}")
+        w("\n")
+        w("## RECOMMENDED ACTIONS\n")
+        w("\n")
+        w("### IMMEDIATE (Critical Issues)\n")
+        self._write_actions(w, by_status["critical"], "🚨 ", "   ✅ No critical issues found\n")
         
-        if critical_actions:
-            for action in critical_actions[:10]:  # Show top 10
-                report_lines.append(f"   {action}")
-        else:
-            report_lines.append("   ✅ No critical issues found")
+        w("\n")
+        w("### SHORT TERM (Warning Issues)\n")
+        self._write_actions(w, by_status["warning"], "⚠️  ", "   ✅ No warning issues found\n")
         
-        report_lines.extend([
-            "",
-            "### SHORT TERM (Warning Issues)",
-        ])
+        w("\n")
+        w("## MONITORING COMMANDS\n")
+        w("   • View latest status: python3 admin/scripts/realtime_monitor.py --status\n")
+        w("   • Full monitoring scan: python3 admin/scripts/realtime_monitor.py --scan\n")
+        w("   • Project-specific: python3 admin/scripts/realtime_monitor.py --project PROJECT_NAME\n")
+        w("   • Watch mode: python3 admin/scripts/realtime_monitor.py --watch\n")
+        w("\n")
+        w("=" * 80)  # No trailing newline; callers print() the result
         
-        warning_actions = []
-        for project_name, project_data in results["projects"].items():
-            if project_data["overall_health"] == "warning":
-                for category in ["git", "quality", "security", "dependencies"]:
-                    for alert in project_data[category].get("alerts", []):
-                        warning_actions.append(f"⚠️  {project_name}: {alert}")
-        
-        if warning_actions:
-            for action in warning_actions[:10]:  # Show top 10
-                report_lines.append(f"   {action}")
-        else:
-            report_lines.append("   ✅ No warning issues found")
-        
-        report_lines.extend([
-            "",
-            "## MONITORING COMMANDS",
-            "   • View latest status: python3 admin/scripts/realtime_monitor.py --status",
-            "   • Full monitoring scan: python3 admin/scripts/realtime_monitor.py --scan",
-            "   • Project-specific: python3 admin/scripts/realtime_monitor.py --project PROJECT_NAME",
-            "   • Watch mode: python3 admin/scripts/realtime_monitor.py --watch",
-            "",
-            "=" * 80
-        ])
-        
-        return "\n".join(report_lines)
+        return buf.getvalue()
+    
+    def _write_actions(self, w, projects: List[tuple], marker: str, none_line: str):
+        """Write up to 10 alerts of the given projects as action items"""
+        written = 0
+        for project_name, project_data in projects:
+            for category, count in project_data["alerts_by_category"].items():
+                if not count:
+                    continue
+                for alert in project_data[category]["alerts"]:
+                    if written == 10:  # Show top 10
+                        return
+                    w(f"   {marker}{project_name}: {alert}\n")
+                    written += 1
+        if not written:
+            w(none_line)
 
 def main():
     import argparse
@@ -607,7 +1162,7 @@ def main():
                 print(f"📂 Project: {result['project']}")
                 print(f"Health: {result['overall_health']}")
                 print(f"Alerts: {result['total_alerts']}")
-                for category in ["git", "quality", "security", "dependencies"]:
+                for category in ALERT_CATEGORIES:
                     alerts = result[category].get("alerts", [])
                     if alerts:
                         print(f"\n{category.title()} Issues:")
@@ -621,18 +1176,7 @@ def main():
         print("Press Ctrl+C to stop")
         
         try:
-            while True:
-                print(f"\n🔍 Monitoring scan at {datetime.now().strftime('%H:%M:%S')}")
-                results = monitor.monitor_all_projects()
-                monitor.save_monitoring_results(results)
-                
-                # Show summary
-                print(f"Status: {results['summary']['healthy_projects']}✅ "
-                      f"{results['summary']['warning_projects']}⚠️ "
-                      f"{results['summary']['critical_projects']}🚨")
-                
-                # Wait 5 minutes
-                time.sleep(300)
+            monitor.watch_projects()
         except KeyboardInterrupt:
             print("\n👋 Monitoring stopped")
 